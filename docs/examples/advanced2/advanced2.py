@@ -123,13 +123,13 @@ if __name__ == '__main__':
     # get plot data
     count = []
     stress = []
-    odb = feapack.model.ODB('advanced2.out', mode='read')                           # open ODB in read-only mode
-    for frame in range(odb.frameCount):                                             # loop for each frame in the ODB
-        odb.goToFrame(frame)                                                        # update internal file pointers to the specified frame
-        mesh = feapack.model.Mesh(nodes=odb.getNodes(), elements=odb.getElements()) # load mesh for the current frame
-        mises = [*odb.getNodeOutputValues('Stress>Equivalent Mises Stress')]        # unpack Mises nodal output field into a list
-        count.append(mesh.elementCount)                                             # save current number of elements
-        stress.append(max(mises))                                                   # save current peak Mises stress
+    with feapack.model.ODB('advanced2.out', mode='read') as odb:                        # open ODB in read-only mode (closed at the end of the block)
+        for frame in range(odb.frameCount):                                             # loop for each frame in the ODB
+            odb.goToFrame(frame)                                                        # update internal file pointers to the specified frame
+            mesh = feapack.model.Mesh(nodes=odb.getNodes(), elements=odb.getElements()) # load mesh for the current frame
+            mises = [*odb.getNodeOutputValues('Stress>Equivalent Mises Stress')]        # unpack Mises nodal output field into a list
+            count.append(mesh.elementCount)                                             # save current number of elements
+            stress.append(max(mises))                                                   # save current peak Mises stress
 
     # plot Mises convergence
     plt.figure()
@@ -1,6 +1,5 @@
 import gmsh
 import numpy as np
-import feapack.gmsh
 import feapack.model
 import feapack.solver
 import feapack.solver.linearAlgebra
@@ -44,42 +43,45 @@ crack = [0]          # initial crack (angles)
 # PROCEDURES
 #-----------------------------------------------------------
 
-# change in global coordinate system to coordinate system aligned with crack
-def rotate(vec_global):
+# rotation matrix from the global coordinate system to the coordinate system aligned with the crack
+def rotationMatrix():
     alpha = np.deg2rad(crack[-1])
-    R = np.array((
-        (np.cos(alpha), -np.sin(alpha)),
-        (np.sin(alpha),  np.cos(alpha)),
-    ), dtype=np.float64)
-    vec_crack = np.zeros(shape=vec_global.shape, dtype=np.float64)
-    for i in range(vec_global.size//2):
-        v_global = np.array((
-            vec_global[i*2 + 0],
-            vec_global[i*2 + 1],
-        ), dtype=np.float64)
-        v_crack = np.matmul(R, v_global)
-        vec_crack[i*2 + 0] = v_crack[0]
-        vec_crack[i*2 + 1] = v_crack[1]
-    return vec_crack
+    c, s = np.cos(alpha), np.sin(alpha)
+    return np.array(((c, -s), (s, c)), dtype=np.float64)
+
+# change in global coordinate system to coordinate system aligned with crack
+def rotate(vec_global, R):
+    # each row of the reshaped vector is a 2D vector (x, y) to be rotated, hence (R*v)^T = v^T*R^T for all rows at once
+    vec_crack = np.matmul(vec_global.reshape(-1, 2), R.T)
+    return vec_crack.reshape(-1)
+
+# strain energies (modes I and II) of the previous step, or None if not available
+class CrackState:
+    __slots__ = ('E1', 'E2')
+    def __init__(self):
+        self.E1 = None
+        self.E2 = None
+state = CrackState()
 
 # compute strain energy
-# if current and previous strain energies are available:
+# if previous strain energies are available:
 # compute strain energy release rate, stress intensity factor, and crack propagation angle
-strain_energy_1, strain_energy_2 = [], []
 def postProcessing(u, K):                                                                # 'u' is the displacement vector, 'K' is the stiffness matrix
     f = feapack.solver.linearAlgebra.spmatmul(K, u)                                      # compute internal forces  'f'
-    u = rotate(u); f = rotate(f)                                                         # change from global to crack coordinate system
-    strain_energy_1.append( 0.5*np.dot(u[0::2], f[0::2]) )                               # compute strain energy (mode I)
-    strain_energy_2.append( 0.5*np.dot(u[1::2], f[1::2]) )                               # compute strain energy (mode II)
-    if len(strain_energy_1) == 2 and len(strain_energy_2) == 2:                          # check if current and previous strain energies are available
-        G1 = abs(strain_energy_1[0] - strain_energy_1[1])/(T*virtual_da)                 # compute strain energy release rate (mode I)
-        G2 = abs(strain_energy_2[0] - strain_energy_2[1])/(T*virtual_da)                 # compute strain energy release rate (mode II)
-        K1 = np.sqrt(G1*E)                                                               # compute stress intensity factor (mode I)
-        K2 = np.sqrt(G2*E)                                                               # compute stress intensity factor (mode II)
-        dtheta = np.arccos((3*K2**2 + np.sqrt(K1**4 + 8*K1**2*K2**2))/(K1**2 + 9*K2**2)) # maximum tangential stress criterion
-        crack.append(crack[-1] + dtheta)                                                 # add next propagation angle
-        strain_energy_1.clear()                                                          # clear state
-        strain_energy_2.clear()
+    R = rotationMatrix()                                                                 # compute rotation matrix once for both vectors
+    u = rotate(u, R).reshape(-1, 2); f = rotate(f, R).reshape(-1, 2)                     # change from global to crack coordinate system (one row per node)
+    energy_1, energy_2 = 0.5*np.einsum('ni,ni->i', u, f).tolist()                        # compute strain energies (modes I and II) in a single pass
+    del u, f, K                                                                          # release references to the (possibly large) arrays
+    if state.E1 is None:                                                                 # check if previous strain energies are available
+        state.E1, state.E2 = energy_1, energy_2                                          # if not, store current strain energies
+        return
+    G1 = abs(state.E1 - energy_1)/(T*virtual_da)                                         # compute strain energy release rate (mode I)
+    G2 = abs(state.E2 - energy_2)/(T*virtual_da)                                         # compute strain energy release rate (mode II)
+    K1 = np.sqrt(G1*E)                                                                   # compute stress intensity factor (mode I)
+    K2 = np.sqrt(G2*E)                                                                   # compute stress intensity factor (mode II)
+    dtheta = np.arccos((3*K2**2 + np.sqrt(K1**4 + 8*K1**2*K2**2))/(K1**2 + 9*K2**2))     # maximum tangential stress criterion
+    crack.append(crack[-1] + dtheta)                                                     # add next propagation angle
+    state.E1, state.E2 = None, None                                                      # clear state
 
 def runIncrement(crack, applyVirtualExtension):
     crack = [*crack] # make copy
@@ -88,46 +90,34 @@ def runIncrement(crack, applyVirtualExtension):
     # CREATING THE MESH WITH GMSH
     #-----------------------------------------------------------
 
-    # initialize Gmsh
-    gmsh.initialize()
-
-    # compute crack path
-    crackPath = [(-W + W_s, H/2.0)]
-    for phi in crack:
-        dx = da*np.cos(np.deg2rad(phi))
-        dy = da*np.sin(np.deg2rad(phi))
-        crackPath.append((
-            crackPath[-1][0] + dx,
-            crackPath[-1][1] + dy,
-        ))
+    # start a new Gmsh model (the Gmsh session is shared by all increments)
+    gmsh.clear()
+    gmsh.model.add(f'STEP_{len(crack)}_{int(applyVirtualExtension) + 1}')
 
     # virtual extension
     if applyVirtualExtension:
         crack.append(crack[-1])
-        phi = crack[-1]
-        dx = virtual_da*np.cos(np.deg2rad(phi))
-        dy = virtual_da*np.sin(np.deg2rad(phi))
-        crackPath.append((
-            crackPath[-1][0] + dx,
-            crackPath[-1][1] + dy,
-        ))
+
+    # tabulate the direction of each crack segment once (the trigonometric functions are evaluated for all angles at once)
+    rads = np.deg2rad(np.asarray(crack, dtype=np.float64))
+    cosp, sinp = np.cos(rads), np.sin(rads)
+    lengths = np.full(len(crack), da)
+    if applyVirtualExtension:
+        lengths[-1] = virtual_da
+
+    # compute crack path
+    # the points are accumulated sequentially (as a running sum), starting from the slot tip
+    steps = np.vstack(((-W + W_s, H/2.0), np.column_stack((lengths*cosp, lengths*sinp))))
+    crackPath = [*map(tuple, np.cumsum(steps, axis=0).tolist())]
 
     # crack tip
     crackTip = crackPath[-1]
 
     # generate seam
-    crackSeam = []
-    for (x, y), phi in zip(crackPath[:-1], crack):
-        psi = phi - 90.0
-        dx = epsilon*np.cos(np.deg2rad(psi))
-        dy = epsilon*np.sin(np.deg2rad(psi))
-        crackSeam.append((x + dx, y + dy))
-    crackSeam.append(crackTip)
-    for (x, y), phi in zip(reversed(crackPath[:-1]), reversed(crack)):
-        psi = phi + 90.0
-        dx = epsilon*np.cos(np.deg2rad(psi))
-        dy = epsilon*np.sin(np.deg2rad(psi))
-        crackSeam.append((x + dx, y + dy))
+    # the seam is offset by epsilon from the crack path, to both sides (psi = phi -/+ 90), in a single pass per side
+    path = np.array(crackPath[:-1], dtype=np.float64)
+    offset = epsilon*np.column_stack((sinp, -cosp)) # (cos(phi - 90), sin(phi - 90)) = (sin(phi), -cos(phi))
+    crackSeam = [*map(tuple, (path + offset).tolist()), crackTip, *map(tuple, (path - offset)[::-1].tolist())]
 
     # point coordinates
     outlineCoords = (
@@ -208,21 +198,32 @@ def runIncrement(crack, applyVirtualExtension):
     # if you want to view the mesh now, uncomment the following line
     # gmsh.fltk.run()
 
-    # write mesh to file
-    gmsh.option.setNumber('Mesh.SaveAll', False)          # default (also works with True, but more unused elements are saved)
-    gmsh.option.setNumber('Mesh.SaveGroupsOfNodes', True) # to save node sets
-    gmsh.write('advanced4.inp')
-
-    # finalize Gmsh
-    gmsh.finalize()
-
     #-----------------------------------------------------------
     # FINITE ELEMENT ANALYSIS WITH FEAPACK
     #-----------------------------------------------------------
 
-    # create model database (MDB)
-    feapack.gmsh.clean('advanced4.inp') # required if inp file is generated by Gmsh
-    mdb = feapack.model.MDB.fromFile('advanced4.inp')
+    # create model database (MDB) directly from the Gmsh model (no intermediate inp file)
+    # Gmsh node tags are mapped to 0-based node indices, keeping only the nodes connected to the domain elements
+    # (Gmsh element types 2 and 3 are the 3-node triangle and the 4-node quadrilateral, respectively)
+    gmshTypes = {2: feapack.model.ElementTypes.Plane3, 3: feapack.model.ElementTypes.Plane4}
+    elementTypes, _, elementNodeTags = gmsh.model.mesh.getElements(2, surface)
+    nodeTags, nodeCoords, _ = gmsh.model.mesh.getNodes()
+    nodeCoords = nodeCoords.reshape(-1, 3)[np.argsort(nodeTags)]
+    nodeTags = np.sort(nodeTags)
+    usedTags = np.unique(np.concatenate(elementNodeTags))
+    nodeData = nodeCoords[np.searchsorted(nodeTags, usedTags)].tolist()
+    elementData = []
+    for type, tags in zip(elementTypes, elementNodeTags):
+        connectivity = np.searchsorted(usedTags, tags).reshape(-1, gmshTypes[type].nodeCount)
+        elementData.extend((gmshTypes[type], tuple(nodeIndices)) for nodeIndices in connectivity.tolist())
+    mdb = feapack.model.MDB(feapack.model.Mesh(nodeData, elementData))
+
+    # create FEAPACK sets from Gmsh physical groups (node sets for all groups and element sets for the domain)
+    for dim, tag in gmsh.model.getPhysicalGroups():
+        name = gmsh.model.getPhysicalName(dim, tag)
+        groupNodeTags, _ = gmsh.model.mesh.getNodesForPhysicalGroup(dim, tag)
+        mdb.nodeSet(name=name, indices=np.searchsorted(usedTags, groupNodeTags))
+        if dim == 2: mdb.elementSet(name=name, indices=range(mdb.mesh.elementCount))
 
     # print available sets
     print('Node sets:', *mdb.nodeSets.keys())       # Node sets: PG-HOLE-1 PG-HOLE-2 PG-DOMAIN
@@ -245,23 +246,23 @@ def runIncrement(crack, applyVirtualExtension):
 
     # solve
     step = f'{len(crack) - int(applyVirtualExtension)}_{int(applyVirtualExtension) + 1}'
-    feapack.solver.solve(mdb, 'static', jobName=f'STEP_{step}', customCallable=postProcessing)
+    # the final output frame of the current crack length (no virtual extension) is appended to the output database
+    feapack.solver.solve(
+        mdb, 'static', jobName=f'STEP_{step}', customCallable=postProcessing,
+        odb=None if applyVirtualExtension else odb, description=f'STEP-{len(crack)}'
+    )
 
 # loop through increments
 # each increment requires two steps
 # 1st step: current crack length
 # 2nd step: current crack length + virtual crack extension
+# Gmsh is initialized once for all increments
+# the output frames are written to a single output database as the increments complete (no merging required)
 increments = 25
+odb = feapack.model.ODB('advanced4.out', mode='write', replace=True)
+gmsh.initialize()
 for _ in range(increments):
     runIncrement(crack, applyVirtualExtension=False)
     runIncrement(crack, applyVirtualExtension=True)
-
-# merge output frames
-print('Merging output frames...')
-feapack.model.ODB.merge(
-    filePath='advanced4.out',
-    selection=[(f'STEP_{i + 1}_1.out', [1]) for i in range(increments)],
-    descriptions=[f'STEP-{i + 1}' for i in range(increments)],
-    deleteExisting=False
-)
+gmsh.finalize()
 print('Done')
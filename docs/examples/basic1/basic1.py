@@ -1,4 +1,4 @@
-import math
+import numpy as np
 import feapack.model
 import feapack.solver
 
@@ -66,9 +66,11 @@ mesh = feapack.model.Mesh(nodeData, elementData)
 mdb = feapack.model.MDB(mesh)
 
 # create node sets
-mdb.nodeSet(name='nodes at x=0', indices=(node.index for node in mdb.mesh.nodes if node.x == 0.0))
-mdb.nodeSet(name='nodes at y=0', indices=(node.index for node in mdb.mesh.nodes if node.y == 0.0))
-mdb.nodeSet(name='nodes at r=77', indices=(node.index for node in mdb.mesh.nodes if abs(math.sqrt(node.x**2 + node.y**2) - 77.0) <= 0.001))
+# selected from the nodal coordinate matrix (one row per node) with vectorized comparisons
+x, y = mdb.mesh.coordinates[:, 0], mdb.mesh.coordinates[:, 1]
+mdb.nodeSet(name='nodes at x=0', indices=np.flatnonzero(x == 0.0))
+mdb.nodeSet(name='nodes at y=0', indices=np.flatnonzero(y == 0.0))
+mdb.nodeSet(name='nodes at r=77', indices=np.flatnonzero(np.abs(np.hypot(x, y) - 77.0) <= 0.001))
 
 # create element set
 mdb.elementSet(name='all elements', indices=range(mdb.mesh.elementCount))
@@ -1,3 +1,4 @@
+import numpy as np
 import feapack.model
 import feapack.solver
 
@@ -8,9 +9,11 @@ if __name__ == '__main__':
     mdb = feapack.model.MDB.fromFile('basic2.inp')
 
     # create node sets
-    mdb.nodeSet(name='nodes at x=0', indices=(node.index for node in mdb.mesh.nodes if node.x == 0.0))
-    mdb.nodeSet(name='nodes at y=0', indices=(node.index for node in mdb.mesh.nodes if node.y == 0.0))
-    mdb.nodeSet(name='nodes at x=100', indices=(node.index for node in mdb.mesh.nodes if node.x == 100.0))
+    # selected from the nodal coordinate matrix (one row per node) with vectorized comparisons
+    x, y = mdb.mesh.coordinates[:, 0], mdb.mesh.coordinates[:, 1]
+    mdb.nodeSet(name='nodes at x=0', indices=np.flatnonzero(x == 0.0))
+    mdb.nodeSet(name='nodes at y=0', indices=np.flatnonzero(y == 0.0))
+    mdb.nodeSet(name='nodes at x=100', indices=np.flatnonzero(x == 100.0))
 
     # create element set
     mdb.elementSet(name='all elements', indices=range(mdb.mesh.elementCount))
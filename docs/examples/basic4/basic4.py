@@ -1,3 +1,4 @@
+import numpy as np
 import feapack.model
 import feapack.solver
 
@@ -8,9 +9,11 @@ if __name__ == '__main__':
     mdb = feapack.model.MDB.fromFile('basic4.inp')
 
     # create sets
+    # nodes are selected from the nodal coordinate matrix (one row per node) with vectorized comparisons
+    x, y = mdb.mesh.coordinates[:, 0], mdb.mesh.coordinates[:, 1]
     mdb.nodeSet(
         name='side nodes',
-        indices=(node.index for node in mdb.mesh.nodes if abs(node.x) == 100.0 or abs(node.y) == 90.0)
+        indices=np.flatnonzero((np.abs(x) == 100.0) | (np.abs(y) == 90.0))
     )
 
     mdb.elementSet(
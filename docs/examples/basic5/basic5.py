@@ -1,3 +1,4 @@
+import numpy as np
 import feapack.model
 import feapack.solver
 
@@ -5,8 +6,10 @@ import feapack.solver
 mdb = feapack.model.MDB.fromFile('basic5.inp')
 
 # create node sets
-mdb.nodeSet(name='nodes at y = 0', indices=(node.index for node in mdb.mesh.nodes if node.y == 0.0))
-mdb.nodeSet(name='nodes at y = 1000', indices=(node.index for node in mdb.mesh.nodes if node.y == 1000.0))
+# selected from the nodal coordinate matrix (one row per node) with vectorized comparisons
+y = mdb.mesh.coordinates[:, 1]
+mdb.nodeSet(name='nodes at y = 0', indices=np.flatnonzero(y == 0.0))
+mdb.nodeSet(name='nodes at y = 1000', indices=np.flatnonzero(y == 1000.0))
 
 # create element set
 mdb.elementSet(name='all elements', indices=range(mdb.mesh.elementCount))
@@ -3,11 +3,19 @@ import sys
 from glob import glob
 from ctypes import CDLL, POINTER, Structure, c_int, c_double, c_char, c_void_p
 
+# locate Intel MKL runtime library
+# the path may be pinned by the FEAPACK_MKL_RT environment variable, which skips the search; otherwise, the most
+# recent version found is used and the resolved path is exported, hence child processes inherit it and skip the search
+_path: str | None = os.environ.get("FEAPACK_MKL_RT")
+if _path is None:
+    _matches: set[str] = set(glob(os.path.join(os.path.dirname(sys.executable), "Library", "bin", "mkl_rt.*.dll")))
+    if len(_matches) == 0: raise RuntimeError("could not load Intel MKL runtime library")
+    _path = max(_matches, key=lambda x: (int(x.split(".")[-2]), x)); del _matches
+    os.environ["FEAPACK_MKL_RT"] = _path
+elif not os.path.isfile(_path): raise RuntimeError(f"could not load Intel MKL runtime library: '{_path}'")
+
 # load Intel MKL runtime library
-_matches: list[str] = glob(os.path.join(os.path.dirname(sys.executable), "Library", "bin", "mkl_rt.*.dll"))
-if len(_matches) == 0: raise RuntimeError("could not load Intel MKL runtime library")
-if len(_matches) > 0: _matches.sort(key=lambda x: int(x.split(".")[-2]), reverse=True)
-_LIB: CDLL = CDLL(_matches[0]); del _matches
+_LIB: CDLL = CDLL(_path); del _path
 
 # status of the routines
 SPARSE_STATUS_SUCCESS          = 0 # the operation was successful
@@ -41,6 +49,10 @@ SPARSE_FILL_MODE_LOWER = 40 # lower triangular part of the matrix is stored
 SPARSE_FILL_MODE_UPPER = 41 # upper triangular part of the matrix is stored
 SPARSE_FILL_MODE_FULL  = 42 # upper triangular part of the matrix is stored
 
+# storage scheme for dense matrices
+SPARSE_LAYOUT_ROW_MAJOR    = 101 # C-style
+SPARSE_LAYOUT_COLUMN_MAJOR = 102 # Fortran-style
+
 # applies to triangular matrices only
 SPARSE_DIAG_NON_UNIT = 50 # triangular matrix with non-unit diagonal
 SPARSE_DIAG_UNIT     = 51 # triangular matrix with unit diagonal
@@ -129,26 +141,43 @@ mkl_sparse_d_mv.argtypes = (    #
     c_double_p,                 # y
 )
 
+# computes a sparse matrix-dense matrix product
+mkl_sparse_d_mm = _LIB.mkl_sparse_d_mm
+mkl_sparse_d_mm.restype = c_int # status
+mkl_sparse_d_mm.argtypes = (    #
+    c_int,                      # operation
+    c_double,                   # alpha
+    sparse_matrix_t,            # A
+    matrix_descr,               # descr
+    c_int,                      # layout
+    c_double_p,                 # x
+    c_int,                      # columns
+    c_int,                      # ldx
+    c_double,                   # beta
+    c_double_p,                 # y
+    c_int,                      # ldy
+)
+
 # calculates the solution of a set of sparse linear equations with single or multiple right-hand sides
 pardiso = _LIB.pardiso
 pardiso.restype = None
 pardiso.argtypes = (
-    c_void_p, # pt
-    c_int_p,  # maxfct
-    c_int_p,  # mnum
-    c_int_p,  # mtype
-    c_int_p,  # phase
-    c_int_p,  # n
-    c_void_p, # a
-    c_int_p,  # ia
-    c_int_p,  # ja
-    c_int_p,  # perm
-    c_int_p,  # nrhs
-    c_int_p,  # iparm
-    c_int_p,  # msglvl
-    c_void_p, # b
-    c_void_p, # x
-    c_int_p,  # error
+    c_void_p,   # pt
+    c_int_p,    # maxfct
+    c_int_p,    # mnum
+    c_int_p,    # mtype
+    c_int_p,    # phase
+    c_int_p,    # n
+    c_double_p, # a
+    c_int_p,    # ia
+    c_int_p,    # ja
+    c_int_p,    # perm
+    c_int_p,    # nrhs
+    c_int_p,    # iparm
+    c_int_p,    # msglvl
+    c_double_p, # b
+    c_double_p, # x
+    c_int_p,    # error
 )
 
 # computes the largest/smallest eigenvalues and corresponding eigenvectors of a generalized sparse eigenproblem
@@ -1,14 +1,18 @@
 import os
+import numpy as np
+import numpy.typing as npt
 from typing import Literal
-from feapack.typing import Float3D
+from feapack.typing import Float3D, IntVector, IntMatrix, RealMatrix
 from feapack.io import AbaqusReader
-from itertools import chain
 
 SUPPORTED_ELEMENT_TYPES = (
     "CPS3", "CPE3", "CAX3", "CPS4", "CPE4", "CAX4", "CPS4R", "CPE4R", "CAX4R", "CPS6", "CPE6", "CAX6", "CPS8", "CPE8",
     "CAX8", "CPS8R", "CPE8R", "CAX8R", "C3D4", "C3D6", "C3D8", "C3D8R", "C3D10", "C3D15", "C3D20", "C3D20R"
 )
 
+_SUPPORTED_ELEMENT_TYPE_SET: frozenset[str] = frozenset(SUPPORTED_ELEMENT_TYPES)
+"""Set of supported element types (for constant-time membership checks)."""
+
 def clean(filePath: str) -> None:
     """Cleans an Abaqus input file (*.inp) generated by Gmsh, making it compatible with FEAPACK."""
     # check extension
@@ -17,134 +21,169 @@ def clean(filePath: str) -> None:
         case _: raise ValueError(f"unsupported file extension: '{ext}'")
 
     # initialize variables
-    setType: str = ""
-    setName: str = ""
+    currentSet: list[int] = []
     elementType: str = ""
-    nodes: list[tuple[list[int], Float3D]] = []
-    elements: dict[str, list[tuple[list[int], list[int]]]] = {type: [] for type in SUPPORTED_ELEMENT_TYPES}
+    nodeLines: list[str] = []
+    elements: dict[str, list[str]] = {}
+    currentElements: list[str] = []
     sets: dict[str, dict[str, list[int]]] = {"node-set": {}, "element-set": {}}
     action: Literal["read-command", "read-node", "read-element", "read-set", "pass"] = "pass"
 
     # read data
     with open(filePath, "r") as file:
-        for line in (lines := AbaqusReader.cleanLines(file)):
+        for line in AbaqusReader.joinElementLines(AbaqusReader.cleanLines(file)):
             if line.startswith("*"):
                 action = "read-command"
             match action:
                 case "read-command":
-                    match line.split(",")[0]:
+                    command, parameters = AbaqusReader.parseCommand(line)
+                    match command:
                         case "*NODE":
                             action = "read-node"
                         case "*ELEMENT":
-                            elementType = line.split("TYPE=")[1].split(",")[0]
-                            action = "read-element" if elementType in SUPPORTED_ELEMENT_TYPES else "pass"
+                            elementType = parameters["TYPE"]
+                            if elementType in _SUPPORTED_ELEMENT_TYPE_SET:
+                                currentElements = elements.setdefault(elementType, [])
+                                action = "read-element"
+                            else:
+                                action = "pass"
                         case "*NSET" | "*ELSET":
-                            setType = "node-set" if line.startswith("*NSET") else "element-set"
-                            setName = line.split("SET=")[1].split(",")[0]
+                            setType: str = "node-set" if command == "*NSET" else "element-set"
+                            currentSet = sets[setType].setdefault(parameters[command[1:]], [])
                             action = "read-set"
                         case _:
                             action = "pass"
                 case "read-node":
-                    newIndex: int = -1
-                    oldIndex: int = int((lineSplit := line.split(","))[0])
-                    coordinates: list[float] = [float(x) for x in lineSplit[1:] if x]
-                    while len(coordinates) < 3: coordinates.append(0.0)
-                    nodes.append(([oldIndex, newIndex], (coordinates[0], coordinates[1], coordinates[2])))
+                    nodeLines.append(line)
                 case "read-element":
-                    newIndex: int = -1
-                    oldIndex: int = int(line.split(",")[0])
-                    connectivity: list[int] = []
-                    skipIndex: bool = True
-                    while True:
-                        connectivity.extend(int(x) for x in line.split(",")[skipIndex:] if x)
-                        if line[-1] == ",":
-                            line = next(iter(lines))
-                            skipIndex = False
-                        else:
-                            break
-                    elements[elementType].append(([oldIndex, newIndex], connectivity))
+                    currentElements.append(line)
                 case "read-set":
-                    if setName not in sets[setType].keys(): sets[setType][setName] = []
-                    sets[setType][setName].extend(int(x) for x in line.split(",") if x)
+                    currentSet.extend(int(x) for x in line.split(",") if x)
                 case "pass":
                     pass
 
-    # sort nodes by their old indices
-    nodes.sort(key=lambda x: x[0][0])
-
-    # determine unconnected/unused nodes
-    for elementType in elements.keys():
-        for _, connectivity in elements[elementType]:
-            for nodeIndex in connectivity:
-                if nodes[nodeIndex - 1][0][0] != nodeIndex: raise RuntimeError("bad node numbering: missing nodes")
-                nodes[nodeIndex - 1][0][1] = -2
-
-    # new node numbering
-    nodeCount: int = 0
-    for node in nodes:
-        if node[0][1] == -2:
-            node[0][1] = nodeCount + 1
-            nodeCount += 1
-
-    # new element numbering
-    elementCount: int = 0
-    for elementType in elements.keys():
-        for element in elements[elementType]:
-            element[0][1] = elementCount + 1
-            elementCount += 1
-
-    # create mappings
-    nodeMapping: dict[int, int] = {node[0][0]: node[0][1] for node in nodes}
-    elementMapping: dict[int, int] = {element[0][0]: element[0][1] for element in chain(*elements.values())}
+    # element types in the order of the supported element types (only the types found in file)
+    elements = {type: elements[type] for type in SUPPORTED_ELEMENT_TYPES if type in elements}
+
+    # parse node data (all lines at once when possible, i.e., when all lines have the same number of fields)
+    nodeIndices: IntVector
+    nodeCoordinates: RealMatrix
+    try:
+        values: RealMatrix = np.loadtxt(nodeLines, dtype=np.float64, delimiter=",", ndmin=2)
+        count: int = min(values.shape[1] - 1, 3)
+        nodeIndices = values[:, 0].astype(np.int64)
+        nodeCoordinates = np.zeros(shape=(values.shape[0], 3), dtype=np.float64)
+        nodeCoordinates[:, :count] = values[:, 1:count + 1]
+    except ValueError:
+        # irregular data lines (e.g., empty fields or a varying number of coordinates), parsed line by line
+        indices: list[int] = []
+        points: list[Float3D] = []
+        for line in nodeLines:
+            oldIndex: int = int((lineSplit := line.split(","))[0])
+            coordinates: list[float] = [float(x) for x in lineSplit[1:] if x]
+            while len(coordinates) < 3: coordinates.append(0.0)
+            indices.append(oldIndex)
+            points.append((coordinates[0], coordinates[1], coordinates[2]))
+        nodeIndices = np.array(indices, dtype=np.int64)
+        nodeCoordinates = np.array(points, dtype=np.float64).reshape(-1, 3)
+
+    # node arrays sorted by their old indices
+    order: IntVector = np.argsort(nodeIndices, kind="stable")
+    oldNodeIndices: IntVector = nodeIndices[order]
+    coordinates: RealMatrix = nodeCoordinates[order]
+
+    # parse element data (one matrix per element type, all lines at once when possible, i.e., no empty fields)
+    # each row holds the old element index followed by the element connectivity (still using the old node indices)
+    elementMatrices: dict[str, IntMatrix] = {}
+    for elementType, records in elements.items():
+        if len(records) == 0: continue
+        try:
+            elementMatrices[elementType] = np.loadtxt(records, dtype=np.int64, delimiter=",", ndmin=2)
+        except ValueError:
+            elementMatrices[elementType] = np.array(
+                [[int(x) for x in record.split(",") if x] for record in records], dtype=np.int64
+            )
+    connectivityMatrices: dict[str, IntMatrix] = {
+        elementType: elementMatrix[:, 1:] for elementType, elementMatrix in elementMatrices.items()
+    }
+
+    # determine connected/used nodes (the old indices are expected to be 1, 2, 3, ..., i.e., no missing nodes)
+    connectivities: IntVector = np.concatenate(
+        [connectivityMatrix.ravel() for connectivityMatrix in connectivityMatrices.values()]
+    ) if connectivityMatrices else np.empty(shape=(0,), dtype=np.int64)
+    if connectivities.size > 0:
+        if connectivities.min() < 1 or connectivities.max() > oldNodeIndices.size or \
+            np.any(oldNodeIndices[connectivities - 1] != connectivities):
+            raise RuntimeError("bad node numbering: missing nodes")
+    used: npt.NDArray[np.bool_] = np.zeros(shape=oldNodeIndices.shape, dtype=np.bool_)
+    used[connectivities - 1] = True
+
+    # new node numbering (in the order of the old indices, -1 for unused nodes)
+    newNodeIndices: IntVector = np.where(used, np.cumsum(used), -1)
+
+    # new element numbering (consecutive, in the order of the element types)
+    oldElementIndices: IntVector = np.concatenate(
+        [elementMatrix[:, 0] for elementMatrix in elementMatrices.values()]
+    ) if elementMatrices else np.empty(shape=(0,), dtype=np.int64)
+    newElementIndices: IntVector = np.arange(1, oldElementIndices.size + 1, dtype=np.int64)
+
+    # create mappings (lookup arrays indexed by the old indices, -1 for unused or non-existent indices)
+    nodeLookup: IntVector = np.full(shape=(oldNodeIndices.max(initial=0) + 1,), fill_value=-1, dtype=np.int64)
+    nodeLookup[oldNodeIndices] = newNodeIndices
+    elementLookup: IntVector = np.full(shape=(oldElementIndices.max(initial=0) + 1,), fill_value=-1, dtype=np.int64)
+    elementLookup[oldElementIndices] = newElementIndices
+
+    # maps old indices to new indices using a lookup array, removing unused or non-existent indices
+    def remap(indices: list[int], lookup: IntVector) -> list[int]:
+        array: IntVector = np.array(indices, dtype=np.int64)
+        array = lookup[array[(array >= 0) & (array < lookup.size)]]
+        return array[array != -1].tolist()
 
     # fix element connectivity
-    for elementType in elements.keys():
-        for element in elements[elementType]:
-            for i in range(len(element[1])):
-                element[1][i] = nodeMapping[element[1][i]]
+    for elementType, connectivityMatrix in connectivityMatrices.items():
+        connectivityMatrices[elementType] = nodeLookup[connectivityMatrix]
 
     # fix node sets
     for setName, nodeSet in sets["node-set"].items():
-        for i in range(len(nodeSet)):
-            if nodeSet[i] in nodeMapping.keys(): nodeSet[i] = nodeMapping[nodeSet[i]]
-            else: nodeSet[i] = -1
-        sets["node-set"][setName] = list(filter(lambda x: x != -1, nodeSet))
+        sets["node-set"][setName] = remap(nodeSet, nodeLookup)
 
     # fix element sets
     for setName, elementSet in sets["element-set"].items():
-        for i in range(len(elementSet)):
-            if elementSet[i] in elementMapping.keys(): elementSet[i] = elementMapping[elementSet[i]]
-            else: elementSet[i] = -1
-        sets["element-set"][setName] = list(filter(lambda x: x != -1, elementSet))
+        sets["element-set"][setName] = remap(elementSet, elementLookup)
 
     # write to file
-    with open(filePath, "w") as file:
+    # the output is built as a list of lines and written at once (a single write call instead of one per line)
+    k: int = 10 # max number of indices per line
+    lines: list[str] = []
+
+    # nodes
+    lines.append("*Node")
+    lines.extend(
+        f"{newIndex}, {x}, {y}, {z}"
+        for newIndex, (x, y, z) in zip(newNodeIndices[used].tolist(), coordinates[used].tolist())
+    )
+
+    # elements
+    firstIndex: int = 1
+    for elementType, connectivityMatrix in connectivityMatrices.items():
+        lines.append(f"*Element, type={elementType}")
+        lines.extend(
+            f"{newIndex}, {", ".join(map(str, connectivity))}"
+            for newIndex, connectivity in enumerate(connectivityMatrix.tolist(), start=firstIndex)
+        )
+        firstIndex += connectivityMatrix.shape[0]
+
+    # node sets
+    for setName, nodeSet in sets["node-set"].items():
+        if len(nodeSet) == 0: continue
+        lines.append(f"*Nset, nset={setName}")
+        lines.extend(", ".join(map(str, nodeSet[i:i+k])) for i in range(0, len(nodeSet), k))
 
-        # nodes
-        file.write("*Node\n")
-        for node in nodes:
-            if node[0][1] > 0:
-                file.write(f"{node[0][1]}, {node[1][0]}, {node[1][1]}, {node[1][2]}\n")
-
-        # elements
-        for elementType in elements.keys():
-            if len(elements[elementType]) == 0: continue
-            file.write(f"*Element, type={elementType}\n")
-            for element in elements[elementType]:
-                if element[0][1] > 0:
-                    file.write(f"{element[0][1]}, {", ".join(map(str, element[1]))}\n")
-
-        # node sets
-        k: int = 10 # max number of indices per line
-        for setName, nodeSet in sets["node-set"].items():
-            if len(nodeSet) == 0: continue
-            file.write(f"*Nset, nset={setName}\n")
-            for i in range(0, len(nodeSet), k):
-                file.write(", ".join(map(str, nodeSet[i:i+k])) + "\n")
-
-        # element sets
-        for setName, elementSet in sets["element-set"].items():
-            if len(elementSet) == 0: continue
-            file.write(f"*Elset, elset={setName}\n")
-            for i in range(0, len(elementSet), k):
-                file.write(", ".join(map(str, elementSet[i:i+k])) + "\n")
+    # element sets
+    for setName, elementSet in sets["element-set"].items():
+        if len(elementSet) == 0: continue
+        lines.append(f"*Elset, elset={setName}")
+        lines.extend(", ".join(map(str, elementSet[i:i+k])) for i in range(0, len(elementSet), k))
+
+    with open(filePath, "w") as file:
+        file.write("\n".join(lines) + "\n")
@@ -1,6 +1,10 @@
+import numpy as np
 from io import TextIOWrapper
 from collections.abc import Iterable
-from feapack.typing import Float3D, IntTuple
+from feapack.typing import Float3D, IntTuple, Int, Real, IntMatrix, RealMatrix
+
+_WHITESPACE: dict[int, None] = str.maketrans("", "", " \t\r\f\v")
+"""Translation table that removes whitespaces (line breaks are kept for splitting the text into lines)."""
 
 class AbaqusReader:
     """I/O class for reading an Abaqus input file."""
@@ -13,11 +17,45 @@ class AbaqusReader:
         For iterating over the specified file while ignoring empty lines and comments.
         The lines are also processed: they are converted to uppercase and whitespaces are removed.
         """
-        for line in file:
-            line = line.strip().replace(" ", "").upper()   # remove whitespaces and convert to uppercase
+        # the whole file is read and processed at once (whitespaces removed and converted to uppercase), then split
+        for line in file.read().upper().translate(_WHITESPACE).splitlines():
             if not line or line.startswith("**"): continue # ignore empty lines and comments
             yield line
 
+    @staticmethod
+    def joinElementLines(lines: Iterable[str]) -> Iterable[str]:
+        """
+        For iterating over (cleaned) lines while joining each element data line that ends with a comma with its
+        continuation lines, i.e., each element is defined by a single line. Other lines are passed through unchanged.
+        """
+        record: str = ""
+        isElementData: bool = False
+        for line in lines:
+            if record:
+                record += line
+                if line[-1] != ",":
+                    yield record
+                    record = ""
+                continue
+            if line[0] == "*":
+                isElementData = line.split(",", maxsplit=1)[0] == "*ELEMENT"
+            elif isElementData and line[-1] == ",":
+                record = line
+                continue
+            yield line
+        if record:
+            yield record
+
+    @staticmethod
+    def parseCommand(line: str) -> tuple[str, dict[str, str]]:
+        """
+        Parses a (cleaned) command line, e.g., `*ELEMENT,TYPE=CPS3,ELSET=DOMAIN`, into its keyword and parameters, e.g.,
+        `("*ELEMENT", {"TYPE": "CPS3", "ELSET": "DOMAIN"})`. The line is split only once. Parameters without a value,
+        e.g., `GENERATE`, are mapped to an empty string.
+        """
+        keyword, *parameters = line.split(",")
+        return keyword, dict((*parameter.split("=", maxsplit=1), "")[:2] for parameter in parameters if parameter)
+
     @property
     def software(self) -> str:
         """The third-party software."""
@@ -52,17 +90,20 @@ class AbaqusReader:
                         indices.extend(range(first, last + inc, inc))
                     else:
                         indices.extend(int(x) - 1 for x in line.split(",") if x)
-                elif line.split(",")[0] == keyword:
-                    readData = True
-                    generate = ",GENERATE" in line
-                    instanceName = line.split("INSTANCE=")[1].split(",")[0] if ",INSTANCE" in line else ""
-                    setName = (instanceName + "." if instanceName else partName + "." if partName else "") + \
-                        line.split("SET=")[1].split(",")[0]
-                    indices = []
-                elif line.split(",")[0] == "*PART":
-                    partName = line.split("NAME=")[1].split(",")[0]
-                elif line.split(",")[0] == "*ENDPART":
-                    partName = ""
+                elif line[0] == "*":
+                    command, parameters = self.parseCommand(line)
+                    match command:
+                        case "*NSET" | "*ELSET" if command == keyword:
+                            readData = True
+                            generate = "GENERATE" in parameters
+                            instanceName = parameters.get("INSTANCE", "")
+                            setName = (instanceName + "." if instanceName else partName + "." if partName else "") + \
+                                parameters[keyword[1:]]
+                            indices = []
+                        case "*PART":
+                            partName = parameters["NAME"]
+                        case "*ENDPART":
+                            partName = ""
             if readData:
                 yield setName, tuple(indices)
 
@@ -80,19 +121,59 @@ class AbaqusReader:
         """
         return self._getSets("*ELSET")
 
+    @staticmethod
+    def _parseNodes(lines: list[str]) -> Iterable[Float3D]:
+        """
+        Parses a block of (cleaned) node data lines into nodal coordinates.
+        The whole block is parsed by a single call when possible, i.e., when all lines have the same number of fields.
+        """
+        try:
+            values: RealMatrix = np.loadtxt(lines, dtype=Real, delimiter=",", ndmin=2)
+        except ValueError:
+            # irregular block (e.g., empty fields or a varying number of coordinates), parsed line by line
+            for line in lines:
+                coordinates: list[float] = [float(x) for x in line.split(",")[1:] if x]
+                while len(coordinates) < 3: coordinates.append(0.0)
+                yield coordinates[0], coordinates[1], coordinates[2]
+            return
+        count: int = min(values.shape[1] - 1, 3)
+        coordinates: RealMatrix = np.zeros(shape=(values.shape[0], 3), dtype=Real)
+        coordinates[:, :count] = values[:, 1:count + 1]
+        for x, y, z in coordinates.tolist(): yield x, y, z
+
     def getNodes(self) -> Iterable[Float3D]:
         """Gets the nodal coordinates from file."""
         readData: bool = False
+        lines: list[str] = []
         with open(self._filePath, "r") as file:
             for line in self.cleanLines(file):
                 if readData and line[0] == "*":
                     readData = False
+                    yield from self._parseNodes(lines)
                 if readData:
-                    coordinates: list[float] = [float(x) for x in line.split(",")[1:] if x]
-                    while len(coordinates) < 3: coordinates.append(0.0)
-                    yield coordinates[0], coordinates[1], coordinates[2]
-                elif line.split(",")[0] == "*NODE":
+                    lines.append(line)
+                elif line[0] == "*" and self.parseCommand(line)[0] == "*NODE":
                     readData = True
+                    lines = []
+            if readData:
+                yield from self._parseNodes(lines)
+
+    @staticmethod
+    def _parseElements(records: list[str]) -> Iterable[IntTuple]:
+        """
+        Parses a block of (cleaned) element data records, i.e., element lines joined with their continuation lines, into
+        nodal connectivities. The whole block is parsed by a single call when possible, i.e., when all records have the
+        same number of fields.
+        Note: 1-based indexing is automatically converted into 0-based indexing.
+        """
+        try:
+            values: IntMatrix = np.loadtxt(records, dtype=Int, delimiter=",", ndmin=2)
+        except ValueError:
+            # irregular block (e.g., empty fields), parsed record by record
+            for record in records:
+                yield tuple(int(x) - 1 for x in record.split(",")[1:] if x)
+            return
+        for connectivity in (values[:, 1:] - 1).tolist(): yield tuple(connectivity)
 
     def getElements(self) -> Iterable[tuple[str, IntTuple]]:
         """
@@ -101,21 +182,19 @@ class AbaqusReader:
         """
         readData: bool = False
         elementType: str = ""
+        records: list[str] = []
         with open(self._filePath, "r") as file:
-            for line in (lines := self.cleanLines(file)):
+            for line in self.joinElementLines(self.cleanLines(file)):
                 if readData and line[0] == "*":
                     readData = False
+                    for connectivity in self._parseElements(records): yield elementType, connectivity
                 if readData:
-                    skipIndex: bool = True
-                    connectivity: list[int] = []
-                    while True:
-                        connectivity.extend(int(x) - 1 for x in line.split(",")[skipIndex:] if x)
-                        if line[-1] == ",":
-                            line = next(iter(lines))
-                            skipIndex = False
-                        else:
-                            break
-                    yield elementType, tuple(connectivity)
-                elif line.split(",")[0] == "*ELEMENT":
-                    readData = True
-                    elementType = line.split("TYPE=")[1].split(",")[0]
+                    records.append(line)
+                elif line[0] == "*":
+                    command, parameters = self.parseCommand(line)
+                    if command == "*ELEMENT":
+                        readData = True
+                        elementType = parameters["TYPE"]
+                        records = []
+            if readData:
+                for connectivity in self._parseElements(records): yield elementType, connectivity
@@ -45,5 +45,13 @@ class BoundaryCondition:
         self._u: float | None = u
         self._v: float | None = v
         self._w: float | None = w
-        self._dofs: IntTuple = tuple(dof for dof, displacement in enumerate((u, v, w)) if displacement is not None)
-        self._displacements: FloatTuple = tuple(displacement for displacement in (u, v, w) if displacement is not None)
+
+        # constrained DOFs and corresponding prescribed displacements, built in a single pass
+        dofs: list[int] = []
+        displacements: list[float] = []
+        for dof, displacement in ((0, u), (1, v), (2, w)):
+            if displacement is not None:
+                dofs.append(dof)
+                displacements.append(displacement)
+        self._dofs: IntTuple = tuple(dofs)
+        self._displacements: FloatTuple = tuple(displacements)
@@ -39,4 +39,4 @@ class ConcentratedLoad:
         self._x: float = x
         self._y: float = y
         self._z: float = z
-        self._magnitude: float = math.sqrt(x*x + y*y + z*z)
+        self._magnitude: float = math.hypot(x, y, z)
@@ -6,8 +6,8 @@ class Element:
     """Definition of a finite element."""
 
     __slots__ = (
-        "_index", "_type", "_nodeIndices", "_nodes", "_section", "_material", "_activeLocalDOFs", "_activeGlobalDOFs",
-        "_inactiveLocalDOFs", "_inactiveGlobalDOFs"
+        "_index", "_type", "_nodeIndices", "_nodeCount", "_dofCount", "_nodes", "_section", "_material",
+        "_activeLocalDOFs", "_activeGlobalDOFs", "_inactiveLocalDOFs", "_inactiveGlobalDOFs"
     )
 
     @property
@@ -28,12 +28,12 @@ class Element:
     @property
     def nodeCount(self) -> int:
         """The number of element nodes."""
-        return self._type.nodeCount
+        return self._nodeCount
 
     @property
     def dofCount(self) -> int:
         """The total number of element degrees of freedom."""
-        return self._type.dofCount
+        return self._dofCount
 
     @property
     def modelingSpace(self) -> ModelingSpaces:
@@ -98,6 +98,10 @@ class Element:
         self._type: ElementTypes = type
         self._nodeIndices: IntTuple = tuple(nodeIndices)
 
+        # the number of nodes and DOFs are fixed by the element type, hence evaluated once
+        self._nodeCount: int = type.nodeCount
+        self._dofCount: int = type.dofCount
+
         # instance variables assigned by the MDB
         self._nodes: Tuple[Node] | None = None
         self._material: Material | None = None
@@ -108,8 +112,8 @@ class Element:
         self._inactiveGlobalDOFs: IntTuple | None = None
 
         # check if the required number of node indices was given
-        if (count := len(self._nodeIndices)) != self.nodeCount:
+        if (count := len(self._nodeIndices)) != self._nodeCount:
             raise ValueError(
-                f"element of type '{self._type.name}' requires exactly {self.nodeCount} nodes for construction, " +
+                f"element of type '{self._type.name}' requires exactly {self._nodeCount} nodes for construction, " +
                 f"but {count} were given"
             )
@@ -1,5 +1,6 @@
+import numpy as np
 from collections.abc import Iterable
-from feapack.typing import IntTuple
+from feapack.typing import Int, IntVector
 
 class ElementSet:
     """
@@ -10,13 +11,17 @@ class ElementSet:
     __slots__ = ("_indices",)
 
     @property
-    def indices(self) -> IntTuple:
-        """The indices in the set."""
+    def indices(self) -> IntVector:
+        """The indices in the set, as a read-only array."""
         return self._indices
 
     def __init__(self, indices: Iterable[int]) -> None:
         """
         Creates a new element index set containing the specified indices.
         Duplicate indices are removed and the index set is sorted.
+        The indices may also be given as an array (or a view of an array), which is not modified.
         """
-        self._indices: IntTuple = tuple(sorted(set(indices)))
+        # stored as a contiguous array of integers, deduplicated and sorted by numpy in a single call
+        if not isinstance(indices, np.ndarray): indices = np.fromiter(indices, dtype=Int)
+        self._indices: IntVector = np.unique(indices).astype(Int, copy=False)
+        self._indices.flags.writeable = False
@@ -1,6 +1,8 @@
+import numpy as np
 from enum import Enum, unique
+from functools import cache
 from feapack.model import ModelingSpaces
-from feapack.typing import IntTuple, Tuple
+from feapack.typing import IntTuple, Tuple, Int, IntVector
 
 @unique
 class ElementTypes(Enum):
@@ -43,184 +45,173 @@ class ElementTypes(Enum):
     """Three-dimensional second-order interpolation element with 20 nodes."""
 
     @staticmethod
+    @cache
     def from3rdParty(software: str, elementType: str) -> "ElementTypes | None":
         """
         Returns the corresponding finite element type given a type from a third-party software.
         If the specified third-party software or its finite element type are unsupported, returns `None`.
+        The results are cached, since mesh readers call this for every element.
         """
-        match software.upper():
-            case "ABAQUS":
-                match elementType.upper():
-                    case "CPS3" | "CPE3" | "CAX3":
-                        return ElementTypes.Plane3
-                    case "CPS4" | "CPE4" | "CAX4" | "CPS4R" | "CPE4R" | "CAX4R":
-                        return ElementTypes.Plane4
-                    case "CPS6" | "CPE6" | "CAX6":
-                        return ElementTypes.Plane6
-                    case "CPS8" | "CPE8" | "CAX8" | "CPS8R" | "CPE8R" | "CAX8R":
-                        return ElementTypes.Plane8
-                    case "C3D4":
-                        return ElementTypes.Volume4
-                    case "C3D6":
-                        return ElementTypes.Volume6
-                    case "C3D8" | "C3D8R":
-                        return ElementTypes.Volume8
-                    case "C3D10":
-                        return ElementTypes.Volume10
-                    case "C3D15":
-                        return ElementTypes.Volume15
-                    case "C3D20" | "C3D20R":
-                        return ElementTypes.Volume20
-                    case _:
-                        return None
-            case _:
-                return None
+        elementTypes: dict[str, ElementTypes] | None = _THIRD_PARTY_ELEMENT_TYPES.get(software.upper())
+        return None if elementTypes is None else elementTypes.get(elementType.upper())
 
     @property
     def cellType(self) -> int:
         """The corresponding VTK cell type."""
-        match self:
-            case ElementTypes.Line2:    return  3 # VTK_LINE
-            case ElementTypes.Line3:    return 21 # VTK_QUADRATIC_EDGE
-            case ElementTypes.Plane3:   return  5 # VTK_TRIANGLE
-            case ElementTypes.Plane4:   return  9 # VTK_QUAD
-            case ElementTypes.Plane6:   return 22 # VTK_QUADRATIC_TRIANGLE
-            case ElementTypes.Plane8:   return 23 # VTK_QUADRATIC_QUAD
-            case ElementTypes.Volume4:  return 10 # VTK_TETRA
-            case ElementTypes.Volume6:  return 13 # VTK_WEDGE
-            case ElementTypes.Volume8:  return 12 # VTK_HEXAHEDRON
-            case ElementTypes.Volume10: return 24 # VTK_QUADRATIC_TETRA
-            case ElementTypes.Volume15: return 26 # VTK_QUADRATIC_WEDGE
-            case ElementTypes.Volume20: return 25 # VTK_QUADRATIC_HEXAHEDRON
+        return _CELL_TYPES[self]
 
     @property
     def nodeCount(self) -> int:
         """The number of element nodes."""
-        match self:
-            case ElementTypes.Line2:    return  2
-            case ElementTypes.Line3:    return  3
-            case ElementTypes.Plane3:   return  3
-            case ElementTypes.Plane4:   return  4
-            case ElementTypes.Plane6:   return  6
-            case ElementTypes.Plane8:   return  8
-            case ElementTypes.Volume4:  return  4
-            case ElementTypes.Volume6:  return  6
-            case ElementTypes.Volume8:  return  8
-            case ElementTypes.Volume10: return 10
-            case ElementTypes.Volume15: return 15
-            case ElementTypes.Volume20: return 20
+        return _NODE_COUNTS[self]
 
     @property
     def dofCount(self) -> int:
         """The total number of element degrees of freedom."""
-        match self:
-            case ElementTypes.Line2:    return  2
-            case ElementTypes.Line3:    return  3
-            case ElementTypes.Plane3:   return  6
-            case ElementTypes.Plane4:   return  8
-            case ElementTypes.Plane6:   return 12
-            case ElementTypes.Plane8:   return 16
-            case ElementTypes.Volume4:  return 12
-            case ElementTypes.Volume6:  return 18
-            case ElementTypes.Volume8:  return 24
-            case ElementTypes.Volume10: return 30
-            case ElementTypes.Volume15: return 45
-            case ElementTypes.Volume20: return 60
+        return _DOF_COUNTS[self]
 
     @property
     def modelingSpace(self) -> ModelingSpaces:
         """The modeling space in which the element resides."""
-        match self:
-            case ElementTypes.Line2:    return ModelingSpaces.OneDimensional
-            case ElementTypes.Line3:    return ModelingSpaces.OneDimensional
-            case ElementTypes.Plane3:   return ModelingSpaces.TwoDimensional
-            case ElementTypes.Plane4:   return ModelingSpaces.TwoDimensional
-            case ElementTypes.Plane6:   return ModelingSpaces.TwoDimensional
-            case ElementTypes.Plane8:   return ModelingSpaces.TwoDimensional
-            case ElementTypes.Volume4:  return ModelingSpaces.ThreeDimensional
-            case ElementTypes.Volume6:  return ModelingSpaces.ThreeDimensional
-            case ElementTypes.Volume8:  return ModelingSpaces.ThreeDimensional
-            case ElementTypes.Volume10: return ModelingSpaces.ThreeDimensional
-            case ElementTypes.Volume15: return ModelingSpaces.ThreeDimensional
-            case ElementTypes.Volume20: return ModelingSpaces.ThreeDimensional
+        return _MODELING_SPACES[self]
 
     @property
     def surfaces(self) -> "Tuple[tuple[ElementTypes, IntTuple]]":
         """The surfaces of the element (surface types and corresponding local nodal connectivity)."""
-        match self:
-            case ElementTypes.Line2 | ElementTypes.Line3:
-                raise NotImplementedError("0D surface in 1D space")
-            case ElementTypes.Plane3:
-                return (
-                    (ElementTypes.Line2, (0, 1)),
-                    (ElementTypes.Line2, (1, 2)),
-                    (ElementTypes.Line2, (2, 0)),
-                )
-            case ElementTypes.Plane4:
-                return (
-                    (ElementTypes.Line2, (0, 1)),
-                    (ElementTypes.Line2, (1, 2)),
-                    (ElementTypes.Line2, (2, 3)),
-                    (ElementTypes.Line2, (3, 0)),
-                )
-            case ElementTypes.Plane6:
-                return (
-                    (ElementTypes.Line3, (0, 1, 3)),
-                    (ElementTypes.Line3, (1, 2, 4)),
-                    (ElementTypes.Line3, (2, 0, 5)),
-                )
-            case ElementTypes.Plane8:
-                return (
-                    (ElementTypes.Line3, (0, 1, 4)),
-                    (ElementTypes.Line3, (1, 2, 5)),
-                    (ElementTypes.Line3, (2, 3, 6)),
-                    (ElementTypes.Line3, (3, 0, 7)),
-                )
-            case ElementTypes.Volume4:
-                return (
-                    (ElementTypes.Plane3, (0, 2, 1)),
-                    (ElementTypes.Plane3, (0, 3, 2)),
-                    (ElementTypes.Plane3, (0, 1, 3)),
-                    (ElementTypes.Plane3, (1, 2, 3)),
-                )
-            case ElementTypes.Volume6:
-                return (
-                    (ElementTypes.Plane3, (0, 2, 1)),
-                    (ElementTypes.Plane3, (3, 4, 5)),
-                    (ElementTypes.Plane4, (0, 3, 5, 2)),
-                    (ElementTypes.Plane4, (0, 1, 4, 3)),
-                    (ElementTypes.Plane4, (1, 2, 5, 4)),
-                )
-            case ElementTypes.Volume8:
-                return (
-                    (ElementTypes.Plane4, (0, 1, 5, 4)),
-                    (ElementTypes.Plane4, (1, 2, 6, 5)),
-                    (ElementTypes.Plane4, (2, 3, 7, 6)),
-                    (ElementTypes.Plane4, (3, 0, 4, 7)),
-                    (ElementTypes.Plane4, (3, 2, 1, 0)),
-                    (ElementTypes.Plane4, (4, 5, 6, 7)),
-                )
-            case ElementTypes.Volume10:
-                return (
-                    (ElementTypes.Plane6, (0, 2, 1, 6, 5, 4)),
-                    (ElementTypes.Plane6, (0, 3, 2, 7, 9, 6)),
-                    (ElementTypes.Plane6, (0, 1, 3, 4, 8, 7)),
-                    (ElementTypes.Plane6, (1, 2, 3, 5, 9, 8)),
-                )
-            case ElementTypes.Volume15:
-                return (
-                    (ElementTypes.Plane6, (0, 2, 1, 8,  7,  6)),
-                    (ElementTypes.Plane6, (3, 4, 5, 9, 10, 11)),
-                    (ElementTypes.Plane8, (0, 3, 5, 2, 12, 11, 14,  8)),
-                    (ElementTypes.Plane8, (0, 1, 4, 3,  6, 13,  9, 12)),
-                    (ElementTypes.Plane8, (1, 2, 5, 4,  7, 14, 10, 13)),
-                )
-            case ElementTypes.Volume20:
-                return (
-                    (ElementTypes.Plane8, (0, 1, 5, 4,  8, 17, 12, 16)),
-                    (ElementTypes.Plane8, (1, 2, 6, 5,  9, 18, 13, 17)),
-                    (ElementTypes.Plane8, (2, 3, 7, 6, 10, 19, 14, 18)),
-                    (ElementTypes.Plane8, (3, 0, 4, 7, 11, 16, 15, 19)),
-                    (ElementTypes.Plane8, (3, 2, 1, 0, 10,  9,  8, 11)),
-                    (ElementTypes.Plane8, (4, 5, 6, 7, 12, 13, 14, 15)),
-                )
+        if self.modelingSpace == ModelingSpaces.OneDimensional: raise NotImplementedError("0D surface in 1D space")
+        return _SURFACES[self]
+
+    @property
+    def surfaceConnectivities(self) -> "Tuple[IntVector]":
+        """The local nodal connectivity of each element surface, as read-only arrays."""
+        if self.modelingSpace == ModelingSpaces.OneDimensional: raise NotImplementedError("0D surface in 1D space")
+        return _SURFACE_CONNECTIVITIES[self]
+
+_ABAQUS_ELEMENT_TYPES: dict[str, ElementTypes] = {
+    "CPS3":   ElementTypes.Plane3,   "CPE3":   ElementTypes.Plane3,   "CAX3":   ElementTypes.Plane3,
+    "CPS4":   ElementTypes.Plane4,   "CPE4":   ElementTypes.Plane4,   "CAX4":   ElementTypes.Plane4,
+    "CPS4R":  ElementTypes.Plane4,   "CPE4R":  ElementTypes.Plane4,   "CAX4R":  ElementTypes.Plane4,
+    "CPS6":   ElementTypes.Plane6,   "CPE6":   ElementTypes.Plane6,   "CAX6":   ElementTypes.Plane6,
+    "CPS8":   ElementTypes.Plane8,   "CPE8":   ElementTypes.Plane8,   "CAX8":   ElementTypes.Plane8,
+    "CPS8R":  ElementTypes.Plane8,   "CPE8R":  ElementTypes.Plane8,   "CAX8R":  ElementTypes.Plane8,
+    "C3D4":   ElementTypes.Volume4,
+    "C3D6":   ElementTypes.Volume6,
+    "C3D8":   ElementTypes.Volume8,  "C3D8R":  ElementTypes.Volume8,
+    "C3D10":  ElementTypes.Volume10,
+    "C3D15":  ElementTypes.Volume15,
+    "C3D20":  ElementTypes.Volume20, "C3D20R": ElementTypes.Volume20,
+}
+"""The corresponding finite element type of each supported Abaqus element type."""
+
+_THIRD_PARTY_ELEMENT_TYPES: dict[str, dict[str, ElementTypes]] = {
+    "ABAQUS": _ABAQUS_ELEMENT_TYPES,
+}
+"""The element type tables of each supported third-party software (keys in uppercase)."""
+
+_CELL_TYPES: dict[ElementTypes, int] = {
+    ElementTypes.Line2:     3, # VTK_LINE
+    ElementTypes.Line3:    21, # VTK_QUADRATIC_EDGE
+    ElementTypes.Plane3:    5, # VTK_TRIANGLE
+    ElementTypes.Plane4:    9, # VTK_QUAD
+    ElementTypes.Plane6:   22, # VTK_QUADRATIC_TRIANGLE
+    ElementTypes.Plane8:   23, # VTK_QUADRATIC_QUAD
+    ElementTypes.Volume4:  10, # VTK_TETRA
+    ElementTypes.Volume6:  13, # VTK_WEDGE
+    ElementTypes.Volume8:  12, # VTK_HEXAHEDRON
+    ElementTypes.Volume10: 24, # VTK_QUADRATIC_TETRA
+    ElementTypes.Volume15: 26, # VTK_QUADRATIC_WEDGE
+    ElementTypes.Volume20: 25, # VTK_QUADRATIC_HEXAHEDRON
+}
+"""The corresponding VTK cell type of each finite element type."""
+
+# the values of the finite element types encode the modeling space (hundreds digit) and the number of nodes (last two
+# digits), e.g., Plane8 = 208, and there is one degree of freedom per node and per dimension
+
+_NODE_COUNTS: dict[ElementTypes, int] = {type: type.value % 100 for type in ElementTypes}
+"""The number of element nodes of each finite element type."""
+
+_DOF_COUNTS: dict[ElementTypes, int] = {type: (type.value % 100)*(type.value // 100) for type in ElementTypes}
+"""The total number of element degrees of freedom of each finite element type."""
+
+_MODELING_SPACES: dict[ElementTypes, ModelingSpaces] = {
+    type: ModelingSpaces(type.value // 100) for type in ElementTypes
+}
+"""The modeling space of each finite element type."""
+
+_SURFACES: dict[ElementTypes, Tuple[tuple[ElementTypes, IntTuple]]] = {
+    ElementTypes.Plane3: (
+        (ElementTypes.Line2, (0, 1)),
+        (ElementTypes.Line2, (1, 2)),
+        (ElementTypes.Line2, (2, 0)),
+    ),
+    ElementTypes.Plane4: (
+        (ElementTypes.Line2, (0, 1)),
+        (ElementTypes.Line2, (1, 2)),
+        (ElementTypes.Line2, (2, 3)),
+        (ElementTypes.Line2, (3, 0)),
+    ),
+    ElementTypes.Plane6: (
+        (ElementTypes.Line3, (0, 1, 3)),
+        (ElementTypes.Line3, (1, 2, 4)),
+        (ElementTypes.Line3, (2, 0, 5)),
+    ),
+    ElementTypes.Plane8: (
+        (ElementTypes.Line3, (0, 1, 4)),
+        (ElementTypes.Line3, (1, 2, 5)),
+        (ElementTypes.Line3, (2, 3, 6)),
+        (ElementTypes.Line3, (3, 0, 7)),
+    ),
+    ElementTypes.Volume4: (
+        (ElementTypes.Plane3, (0, 2, 1)),
+        (ElementTypes.Plane3, (0, 3, 2)),
+        (ElementTypes.Plane3, (0, 1, 3)),
+        (ElementTypes.Plane3, (1, 2, 3)),
+    ),
+    ElementTypes.Volume6: (
+        (ElementTypes.Plane3, (0, 2, 1)),
+        (ElementTypes.Plane3, (3, 4, 5)),
+        (ElementTypes.Plane4, (0, 3, 5, 2)),
+        (ElementTypes.Plane4, (0, 1, 4, 3)),
+        (ElementTypes.Plane4, (1, 2, 5, 4)),
+    ),
+    ElementTypes.Volume8: (
+        (ElementTypes.Plane4, (0, 1, 5, 4)),
+        (ElementTypes.Plane4, (1, 2, 6, 5)),
+        (ElementTypes.Plane4, (2, 3, 7, 6)),
+        (ElementTypes.Plane4, (3, 0, 4, 7)),
+        (ElementTypes.Plane4, (3, 2, 1, 0)),
+        (ElementTypes.Plane4, (4, 5, 6, 7)),
+    ),
+    ElementTypes.Volume10: (
+        (ElementTypes.Plane6, (0, 2, 1, 6, 5, 4)),
+        (ElementTypes.Plane6, (0, 3, 2, 7, 9, 6)),
+        (ElementTypes.Plane6, (0, 1, 3, 4, 8, 7)),
+        (ElementTypes.Plane6, (1, 2, 3, 5, 9, 8)),
+    ),
+    ElementTypes.Volume15: (
+        (ElementTypes.Plane6, (0, 2, 1, 8,  7,  6)),
+        (ElementTypes.Plane6, (3, 4, 5, 9, 10, 11)),
+        (ElementTypes.Plane8, (0, 3, 5, 2, 12, 11, 14,  8)),
+        (ElementTypes.Plane8, (0, 1, 4, 3,  6, 13,  9, 12)),
+        (ElementTypes.Plane8, (1, 2, 5, 4,  7, 14, 10, 13)),
+    ),
+    ElementTypes.Volume20: (
+        (ElementTypes.Plane8, (0, 1, 5, 4,  8, 17, 12, 16)),
+        (ElementTypes.Plane8, (1, 2, 6, 5,  9, 18, 13, 17)),
+        (ElementTypes.Plane8, (2, 3, 7, 6, 10, 19, 14, 18)),
+        (ElementTypes.Plane8, (3, 0, 4, 7, 11, 16, 15, 19)),
+        (ElementTypes.Plane8, (3, 2, 1, 0, 10,  9,  8, 11)),
+        (ElementTypes.Plane8, (4, 5, 6, 7, 12, 13, 14, 15)),
+    ),
+}
+"""The surfaces of each two- or three-dimensional finite element type."""
+
+_SURFACE_CONNECTIVITIES: dict[ElementTypes, Tuple[IntVector]] = {
+    type: tuple(np.array(localConnectivity, dtype=Int) for _, localConnectivity in surfaces)
+    for type, surfaces in _SURFACES.items()
+}
+"""The local nodal connectivity of each surface of each two- or three-dimensional finite element type, as arrays."""
+
+# the arrays are shared by all accesses, hence read-only
+for surfaceConnectivities in _SURFACE_CONNECTIVITIES.values():
+    for surfaceConnectivity in surfaceConnectivities: surfaceConnectivity.flags.writeable = False
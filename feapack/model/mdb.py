@@ -1,6 +1,9 @@
 import os
+import numpy as np
+import numpy.typing as npt
+from itertools import compress
 from collections.abc import Iterable
-from feapack.typing import Int2D
+from feapack.typing import IntTuple, Int, IntVector, IntMatrix
 from feapack.io import MeshReader, AbaqusReader
 from feapack.model import SectionTypes, Element, Mesh, NodeSet, ElementSet, SurfaceSet, Material, Section, \
     ConcentratedLoad, SurfaceTraction, Pressure, BodyLoad, Acceleration, BoundaryCondition
@@ -115,18 +118,18 @@ class MDB:
         Adds a new node index set to the model database.
         The set is linked to the specified name and contains the specified indices.
         Duplicate indices are removed and the set is sorted.
+        The indices may be any iterable of integers, including an array (e.g., from `np.flatnonzero`).
         """
-        if name in self._nodeSets.keys(): raise ValueError(f"name '{name}' is already in use")
-        self._nodeSets[name] = NodeSet(indices)
+        self._add(self._nodeSets, name, NodeSet(indices))
 
     def elementSet(self, name: str, indices: Iterable[int]) -> None:
         """
         Adds a new element index set to the model database.
         The set is linked to the specified name and contains the specified indices.
         Duplicate indices are removed and the set is sorted.
+        The indices may be any iterable of integers, including an array (e.g., from `np.flatnonzero`).
         """
-        if name in self._elementSets.keys(): raise ValueError(f"name '{name}' is already in use")
-        self._elementSets[name] = ElementSet(indices)
+        self._add(self._elementSets, name, ElementSet(indices))
 
     def surfaceSet(self, name: str, surfaceNodes: NodeSet | str | Iterable[int]) -> None:
         """
@@ -135,29 +138,36 @@ class MDB:
         The nodes that lie on the surface may be specified as a node set, the name of an existing node set, or as any
         iterable of node indices.
         """
+        # check name first (before the surface search)
+        if name in self._surfaceSets: raise ValueError(f"name '{name}' is already in use")
+
         # build index set of nodes that lie on the surface
         nodeIndexSet: set[int]
         if isinstance(surfaceNodes, NodeSet): nodeIndexSet = set(surfaceNodes.indices)
         elif isinstance(surfaceNodes, str): nodeIndexSet = set(self._nodeSets[surfaceNodes].indices)
         else: nodeIndexSet = set(surfaceNodes)
 
-        # build index set of elements connected to the surface nodes
-        elementIndexSet: set[int] = set()
-        for nodeIndex in nodeIndexSet:
-            elementIndexSet.update(self._mesh.nodeToElementsMap[nodeIndex])
-
-        # build index set of element surfaces that make up the whole surface
-        surfaceIndexSet: set[Int2D] = set()
-        for elementIndex in elementIndexSet:
-            element: Element = self._mesh.elements[elementIndex]
-            for surfaceIndex, (_, localConnectivity) in enumerate(element.surfaces):
-                globalConnectivity: list[int] = [element.nodeIndices[i] for i in localConnectivity]
-                if all(nodeIndex in nodeIndexSet for nodeIndex in globalConnectivity):
-                    surfaceIndexSet.add((elementIndex, surfaceIndex))
+        # mask of nodes that lie on the surface
+        isSurfaceNode: npt.NDArray[np.bool_] = np.zeros(shape=(self._mesh.nodeCount,), dtype=np.bool_)
+        isSurfaceNode[list(nodeIndexSet)] = True
+
+        # build index set of element surfaces that make up the whole surface, i.e., surfaces whose nodes are all surface
+        # nodes (checked for all candidate elements at once, one group of elements with the same number of nodes at a
+        # time, which also have the same element type since all mesh elements reside in the same modeling space)
+        # (the surface indices are collected as blocks of (element index, surface index) rows)
+        surfaceIndexBlocks: list[IntMatrix] = [np.empty(shape=(0, 2), dtype=Int)]
+        for elementIndices, connectivity in self._mesh.connectivities.values():
+            candidates: npt.NDArray[np.bool_] = isSurfaceNode[connectivity].any(axis=1) # connected to the surface
+            if not candidates.any(): continue
+            elementIndices, connectivity = elementIndices[candidates], connectivity[candidates]
+            element: Element = self._mesh.elements[int(elementIndices[0])]
+            for surfaceIndex, localConnectivity in enumerate(element.type.surfaceConnectivities):
+                isOnSurface: npt.NDArray[np.bool_] = isSurfaceNode[connectivity[:, localConnectivity]].all(axis=1)
+                onSurface: IntVector = elementIndices[isOnSurface]
+                surfaceIndexBlocks.append(np.column_stack((onSurface, np.full_like(onSurface, surfaceIndex))))
 
         # save surface index set
-        if name in self._surfaceSets.keys(): raise ValueError(f"name '{name}' is already in use")
-        self._surfaceSets[name] = SurfaceSet(surfaceIndexSet)
+        self._surfaceSets[name] = SurfaceSet(np.concatenate(surfaceIndexBlocks))
 
     def material(self, name: str, young: float, poisson: float, density: float = 0.0) -> None:
         """
@@ -165,8 +175,7 @@ class MDB:
         The material is linked to the specified name and defined by the specified Young's modulus, Poisson's ratio, and
         mass density.
         """
-        if name in self._materials.keys(): raise ValueError(f"name '{name}' is already in use")
-        self._materials[name] = Material(young, poisson, density)
+        self._add(self._materials, name, Material(young, poisson, density))
 
     def section(
         self, name: str, region: str, material: str, type: SectionTypes | str | int, thickness: float = 1.0,
@@ -181,8 +190,7 @@ class MDB:
         A reduced integration flag can also be set to determine if a reduced integration scheme should be used when
         available (by default, full integration is used).
         """
-        if name in self._sections.keys(): raise ValueError(f"name '{name}' is already in use")
-        self._sections[name] = Section(region, material, type, thickness, reducedIntegration)
+        self._add(self._sections, name, Section(region, material, type, thickness, reducedIntegration))
 
     def concentratedLoad(self, name: str, region: str, x: float = 0.0, y: float = 0.0, z: float = 0.0) -> None:
         """
@@ -190,8 +198,7 @@ class MDB:
         The load is applied to the specified region, which is defined by the name of a node set.
         The load is defined by its individual components along the global axes.
         """
-        if name in self._concentratedLoads.keys(): raise ValueError(f"name '{name}' is already in use")
-        self._concentratedLoads[name] = ConcentratedLoad(region, x, y, z)
+        self._add(self._concentratedLoads, name, ConcentratedLoad(region, x, y, z))
 
     def surfaceTraction(self, name: str, region: str, x: float = 0.0, y: float = 0.0, z: float = 0.0) -> None:
         """
@@ -199,8 +206,7 @@ class MDB:
         The load is applied to the specified region, which is defined by the name of a surface set.
         The load is defined by its individual components along the global axes.
         """
-        if name in self._surfaceTractions.keys(): raise ValueError(f"name '{name}' is already in use")
-        self._surfaceTractions[name] = SurfaceTraction(region, x, y, z)
+        self._add(self._surfaceTractions, name, SurfaceTraction(region, x, y, z))
 
     def pressure(self, name: str, region: str, magnitude: float) -> None:
         """
@@ -208,8 +214,7 @@ class MDB:
         The load is applied to the specified region, which is defined by the name of a surface set.
         The load is defined by its magnitude.
         """
-        if name in self._pressures.keys(): raise ValueError(f"name '{name}' is already in use")
-        self._pressures[name] = Pressure(region, magnitude)
+        self._add(self._pressures, name, Pressure(region, magnitude))
 
     def bodyLoad(self, name: str, region: str, x: float = 0.0, y: float = 0.0, z: float = 0.0) -> None:
         """
@@ -217,8 +222,7 @@ class MDB:
         The load is applied to the specified region, which is defined by the name of an element set.
         The load is defined by its individual components along the global axes.
         """
-        if name in self._bodyLoads.keys(): raise ValueError(f"name '{name}' is already in use")
-        self._bodyLoads[name] = BodyLoad(region, x, y, z)
+        self._add(self._bodyLoads, name, BodyLoad(region, x, y, z))
 
     def acceleration(self, name: str, region: str, x: float = 0.0, y: float = 0.0, z: float = 0.0) -> None:
         """
@@ -226,8 +230,7 @@ class MDB:
         The acceleration is applied to the specified region, which is defined by the name of an element set.
         The acceleration is defined by its individual components along the global axes.
         """
-        if name in self._accelerations.keys(): raise ValueError(f"name '{name}' is already in use")
-        self._accelerations[name] = Acceleration(region, x, y, z)
+        self._add(self._accelerations, name, Acceleration(region, x, y, z))
 
     def boundaryCondition(
         self, name: str, region: str, u: float | None = None, v: float | None = None, w: float | None = None
@@ -238,8 +241,39 @@ class MDB:
         The boundary condition is applied to the specified region, which is defined by the name of a node set.
         The boundary condition is defined by its individual components along the global axes.
         """
-        if name in self._boundaryConditions.keys(): raise ValueError(f"name '{name}' is already in use")
-        self._boundaryConditions[name] = BoundaryCondition(region, u, v, w)
+        self._add(self._boundaryConditions, name, BoundaryCondition(region, u, v, w))
+
+    def reorderRCM(self) -> IntVector:
+        """
+        Renumbers the mesh nodes using the reverse Cuthill-McKee algorithm, which typically reduces the bandwidth of the
+        system matrices of unstructured meshes and improves memory locality during assembly. The mesh is replaced by a
+        renumbered mesh and the node sets are updated accordingly (elements, element sets, and surface sets are
+        unaffected). Node indices held elsewhere must be mapped accordingly, hence this should be called right after
+        creating the model database. Returns the vector that maps each new node index to the corresponding (old) node
+        index.
+        """
+        # compute ordering and its inverse
+        order: IntVector = self._mesh.reverseCuthillMcKee()
+        newIndices: IntVector = np.empty_like(order)
+        newIndices[order] = np.arange(order.size, dtype=Int)
+
+        # renumber mesh
+        self._mesh = Mesh(
+            nodes=self._mesh.getCoordinates(order).tolist(),
+            elements=(
+                (element.type, tuple(newIndices[[*element.nodeIndices]].tolist())) for element in self._mesh.elements
+            )
+        )
+
+        # renumber node sets
+        for name, nodeSet in self._nodeSets.items():
+            self._nodeSets[name] = NodeSet(newIndices[[*nodeSet.indices]])
+        return order
+
+    def _add[T](self, container: dict[str, T], name: str, entity: T) -> None:
+        """Adds the specified entity to the specified container, linking it to the specified (unique) name."""
+        if name in container: raise ValueError(f"name '{name}' is already in use")
+        container[name] = entity
 
     def _buildDOFs(self) -> None:
         """
@@ -256,73 +290,53 @@ class MDB:
         # True: DOF is active
         m: int = self.mesh.nodeCount
         n: int = self.mesh.modelingSpace.value
-        tableActive: list[list[bool]] = [[True for _ in range(n)] for _ in range(m)]
+        active: npt.NDArray[np.bool_] = np.ones(shape=(m, n), dtype=np.bool_)
         for boundaryCondition in self.boundaryConditions.values():
-            for dof in boundaryCondition.dofs:
-                if 0 <= dof < n:
-                    for nodeIndex in self.nodeSets[boundaryCondition.region].indices:
-                        tableActive[nodeIndex][dof] = False
-
-        # enumerate each active and inactive DOF
-        activeDOFCount: int = 0
-        inactiveDOFCount: int = 0
-        tableDOFs: list[list[int]] = [[0 for _ in range(n)] for _ in range(m)]
-        for i in range(m):
-            for j in range(n):
-                if tableActive[i][j]:
-                    tableDOFs[i][j] = activeDOFCount
-                    activeDOFCount += 1
+            dofs: list[int] = [dof for dof in boundaryCondition.dofs if 0 <= dof < n]
+            nodeIndices: IntVector = np.array(self.nodeSets[boundaryCondition.region].indices, dtype=Int)
+            active[np.ix_(nodeIndices, dofs)] = False
+
+        # enumerate each active and inactive DOF (row by row, i.e., node by node)
+        # the running counts of active and inactive DOFs give the indices of each active and inactive DOF
+        activeDOFCount: int = int(np.count_nonzero(active))
+        inactiveDOFCount: int = active.size - activeDOFCount
+        runningActive: IntMatrix = np.cumsum(active, dtype=Int).reshape(m, n)
+        runningInactive: IntMatrix = np.cumsum(~active, dtype=Int).reshape(m, n)
+        tableDOFs: IntMatrix = np.where(active, runningActive, runningInactive) - 1
+
+        # splits the DOFs of each row into active and inactive local and global DOFs
+        # rows without inactive DOFs (the most common case) share the same tuple of local DOFs
+        def splitDOFs(
+            activeRows: list[list[bool]], dofRows: list[list[int]]
+        ) -> Iterable[tuple[IntTuple, IntTuple, IntTuple, IntTuple]]:
+            localDOFs: IntTuple = tuple(range(len(activeRows[0]))) if activeRows else ()
+            for isActive, globalDOFs in zip(activeRows, dofRows):
+                if all(isActive):
+                    yield localDOFs, tuple(globalDOFs), (), ()
                 else:
-                    tableDOFs[i][j] = inactiveDOFCount
-                    inactiveDOFCount += 1
-
-        # assign to each element
-        k: int = self.mesh.elementCount
-        elementWiseActiveLocalDOFs: list[list[int]] = [[] for _ in range(k)]
-        elementWiseActiveGlobalDOFs: list[list[int]] = [[] for _ in range(k)]
-        elementWiseInactiveLocalDOFs: list[list[int]] = [[] for _ in range(k)]
-        elementWiseInactiveGlobalDOFs: list[list[int]] = [[] for _ in range(k)]
-        for element in self.mesh.elements:
-            for localNodeIndex, globalNodeIndex in enumerate(element.nodeIndices):
-                for dof in range(n):
-                    localDOF: int = localNodeIndex*n + dof
-                    globalDOF: int = tableDOFs[globalNodeIndex][dof]
-                    if tableActive[globalNodeIndex][dof]:
-                        elementWiseActiveLocalDOFs[element.index].append(localDOF)
-                        elementWiseActiveGlobalDOFs[element.index].append(globalDOF)
-                    else:
-                        elementWiseInactiveLocalDOFs[element.index].append(localDOF)
-                        elementWiseInactiveGlobalDOFs[element.index].append(globalDOF)
+                    isInactive: list[bool] = [not x for x in isActive]
+                    yield (
+                        tuple(compress(localDOFs, isActive)), tuple(compress(globalDOFs, isActive)),
+                        tuple(compress(localDOFs, isInactive)), tuple(compress(globalDOFs, isInactive))
+                    )
+
+        # assign to each element (batched by number of element nodes)
+        # the local DOFs of an element are ordered node by node, i.e., local DOF = local node index * n + nodal DOF
+        for nodeCount, (elementIndices, connectivity) in self.mesh.connectivities.items():
+            elementWiseActive: list[list[bool]] = active[connectivity].reshape(-1, nodeCount*n).tolist()
+            elementWiseDOFs: list[list[int]] = tableDOFs[connectivity].reshape(-1, nodeCount*n).tolist()
+            for elementIndex, dofs in zip(elementIndices.tolist(), splitDOFs(elementWiseActive, elementWiseDOFs)):
+                element: Element = self.mesh.elements[elementIndex]
+                element._activeLocalDOFs, element._activeGlobalDOFs, \
+                    element._inactiveLocalDOFs, element._inactiveGlobalDOFs = dofs
 
         # assign to each node
-        nodeWiseActiveLocalDOFs: list[list[int]] = [[] for _ in range(m)]
-        nodeWiseActiveGlobalDOFs: list[list[int]] = [[] for _ in range(m)]
-        nodeWiseInactiveLocalDOFs: list[list[int]] = [[] for _ in range(m)]
-        nodeWiseInactiveGlobalDOFs: list[list[int]] = [[] for _ in range(m)]
-        for node in self.mesh.nodes:
-            for dof in range(n):
-                localDOF: int = dof
-                globalDOF: int = tableDOFs[node.index][dof]
-                if tableActive[node.index][dof]:
-                    nodeWiseActiveLocalDOFs[node.index].append(localDOF)
-                    nodeWiseActiveGlobalDOFs[node.index].append(globalDOF)
-                else:
-                    nodeWiseInactiveLocalDOFs[node.index].append(localDOF)
-                    nodeWiseInactiveGlobalDOFs[node.index].append(globalDOF)
+        for node, dofs in zip(self.mesh.nodes, splitDOFs(active.tolist(), tableDOFs.tolist())):
+            node._activeLocalDOFs, node._activeGlobalDOFs, node._inactiveLocalDOFs, node._inactiveGlobalDOFs = dofs
 
         # store results
         self.mesh._activeDOFCount = activeDOFCount
         self.mesh._inactiveDOFCount = inactiveDOFCount
-        for element in self.mesh.elements:
-            element._activeLocalDOFs = tuple(elementWiseActiveLocalDOFs[element.index])
-            element._activeGlobalDOFs = tuple(elementWiseActiveGlobalDOFs[element.index])
-            element._inactiveLocalDOFs = tuple(elementWiseInactiveLocalDOFs[element.index])
-            element._inactiveGlobalDOFs = tuple(elementWiseInactiveGlobalDOFs[element.index])
-        for node in self.mesh.nodes:
-            node._activeLocalDOFs = tuple(nodeWiseActiveLocalDOFs[node.index])
-            node._activeGlobalDOFs = tuple(nodeWiseActiveGlobalDOFs[node.index])
-            node._inactiveLocalDOFs = tuple(nodeWiseInactiveLocalDOFs[node.index])
-            node._inactiveGlobalDOFs = tuple(nodeWiseInactiveGlobalDOFs[node.index])
 
     def _assignElementProperties(self) -> None:
         """
@@ -331,14 +345,17 @@ class MDB:
         Attempting to get such properties before calling this functions results in a runtime error.
         The MDB should be checked/validated before calling this function.
         """
-        # nodes
-        for element in self.mesh.elements:
-            element._nodes = self.mesh.getNodes(element.nodeIndices)
+        # nodes (gathered for all elements with the same number of nodes at once, from an object array of mesh nodes)
+        nodes: npt.NDArray[np.object_] = np.empty(shape=(self.mesh.nodeCount,), dtype=object)
+        nodes[:] = self.mesh.nodes
+        for elementIndices, connectivity in self.mesh.connectivities.values():
+            for elementIndex, elementNodes in zip(elementIndices.tolist(), nodes[connectivity].tolist()):
+                self.mesh.elements[elementIndex]._nodes = tuple(elementNodes)
 
         # materials and sections
         for section in self.sections.values():
             material: Material = self.materials[section.material]
-            for elementIndex in self.elementSets[section.region].indices:
+            for elementIndex in self.elementSets[section.region].indices.tolist():
                 element: Element = self.mesh.elements[elementIndex]
                 element._section = section
                 element._material = material
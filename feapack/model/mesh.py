@@ -1,13 +1,18 @@
+import numpy as np
+import numpy.typing as npt
 from operator import itemgetter
 from collections.abc import Iterable
-from feapack.typing import Float3D, IntTuple, Tuple
+from feapack.typing import Float3D, IntTuple, Tuple, Int, IntVector, IntMatrix, Real, RealMatrix
 from feapack.model import ModelingSpaces, ElementTypes, Node, Element
 from feapack.io import MeshReader
 
 class Mesh:
     """Definition of a finite element mesh."""
 
-    __slots__ = ("_modelingSpace", "_nodes", "_elements", "_nodeToElementsMap", "_activeDOFCount", "_inactiveDOFCount")
+    __slots__ = (
+        "_modelingSpace", "_nodes", "_elements", "_nodeToElementsMap", "_activeDOFCount", "_inactiveDOFCount",
+        "_coordinates", "_connectivities"
+    )
 
     @classmethod
     def fromReader(cls, reader: MeshReader) -> "Mesh":
@@ -50,6 +55,20 @@ class Mesh:
         """The mesh elements."""
         return self._elements
 
+    @property
+    def coordinates(self) -> RealMatrix:
+        """The nodal coordinates of all mesh nodes, as a read-only C-contiguous matrix (one row per node)."""
+        return self._coordinates
+
+    @property
+    def connectivities(self) -> dict[int, tuple[IntVector, IntMatrix]]:
+        """
+        The nodal connectivity of all mesh elements, grouped by number of element nodes. Maps each number of element
+        nodes to the indices of the corresponding elements and their nodal connectivity, as read-only arrays (one row
+        per element).
+        """
+        return self._connectivities
+
     @property
     def nodeToElementsMap(self) -> Tuple[IntTuple]:
         """A container that maps a node index to the indices of the elements connected to that node."""
@@ -78,15 +97,18 @@ class Mesh:
             nodeIndices
         ) for type, nodeIndices in elements)
 
-        # build node array
+        # build node array and the corresponding nodal coordinate matrix (one row per node)
+        nodes = [*nodes]
         self._nodes: Tuple[Node] = tuple(Node(index, x, y, z) for index, (x, y, z) in enumerate(nodes))
+        self._coordinates: RealMatrix = np.array(nodes, dtype=Real).reshape(-1, 3)
+        self._coordinates.flags.writeable = False
 
         # check for no nodes
         if self.nodeCount == 0:
             raise ValueError("mesh contains no nodes")
 
         # get modeling space based on nodal coordinates
-        self._modelingSpace: ModelingSpaces = ModelingSpaces.fromCoordinates(node.coordinates for node in self._nodes)
+        self._modelingSpace: ModelingSpaces = ModelingSpaces.fromCoordinates(self._coordinates)
         if self._modelingSpace not in (ModelingSpaces.TwoDimensional, ModelingSpaces.ThreeDimensional):
             raise ValueError("a 2D or 3D mesh is required")
 
@@ -101,18 +123,39 @@ class Mesh:
         if self.elementCount == 0:
             raise ValueError("mesh contains no elements")
 
-        # get element indices connected to each mesh node
-        nodeToElementsMap: list[list[int]] = [[] for _ in range(self.nodeCount)]
-        for element in self._elements:
-            for nodeIndex in element.nodeIndices:
-                if 0 <= nodeIndex < self.nodeCount: nodeToElementsMap[nodeIndex].append(element.index)
-                else: raise ValueError("element referencing non-existent node detected")
-        self._nodeToElementsMap: Tuple[IntTuple] = tuple(tuple(list) for list in nodeToElementsMap)
+        # build nodal connectivity matrices, grouped by number of element nodes
+        groups: dict[int, list[Element]] = {}
+        for element in self._elements: groups.setdefault(element.nodeCount, []).append(element)
+        self._connectivities: dict[int, tuple[IntVector, IntMatrix]] = {}
+        for nodeCount, group in groups.items():
+            indices: IntVector = np.array([element.index for element in group], dtype=Int)
+            connectivity: IntMatrix = np.array([element.nodeIndices for element in group], dtype=Int)
+            indices.flags.writeable = False
+            connectivity.flags.writeable = False
+            self._connectivities[nodeCount] = (indices, connectivity)
+
+        # all (node index, element index) pairs, i.e., the flattened nodal connectivity of all elements
+        nodeIndices: IntVector = np.concatenate(
+            [connectivity.reshape(-1) for _, connectivity in self._connectivities.values()]
+        )
+        elementIndices: IntVector = np.concatenate(
+            [np.repeat(indices, connectivity.shape[1]) for indices, connectivity in self._connectivities.values()]
+        )
+        if nodeIndices.min() < 0 or nodeIndices.max() >= self.nodeCount:
+            raise ValueError("element referencing non-existent node detected")
+
+        # get element indices connected to each mesh node (sorted by node index, then by element index)
+        counts: IntVector = np.bincount(nodeIndices, minlength=self.nodeCount)
+        pointers: list[int] = np.concatenate(((0,), np.cumsum(counts))).tolist()
+        connected: list[int] = elementIndices[np.lexsort((elementIndices, nodeIndices))].tolist()
+        self._nodeToElementsMap: Tuple[IntTuple] = tuple(
+            tuple(connected[start:end]) for start, end in zip(pointers[:-1], pointers[1:])
+        )
 
         # check for unconnected nodes
-        for nodeIndex, elementIndices in enumerate(self._nodeToElementsMap):
-            if len(elementIndices) == 0:
-                raise ValueError(f"unconnected node detected: node {nodeIndex} at {self._nodes[nodeIndex].coordinates}")
+        if (unconnected := np.flatnonzero(counts == 0)).size > 0:
+            nodeIndex: int = int(unconnected[0])
+            raise ValueError(f"unconnected node detected: node {nodeIndex} at {self._nodes[nodeIndex].coordinates}")
 
         # instance variables assigned by the MDB
         self._activeDOFCount: int | None = None
@@ -122,6 +165,81 @@ class Mesh:
         """Returns the nodes associated with the given indices."""
         return itemgetter(*indices)(self.nodes)
 
+    def getCoordinates(self, indices: Iterable[int]) -> RealMatrix:
+        """
+        Returns the nodal coordinates associated with the given indices, as a matrix (one row per node).
+        The indices may also be given as an array, which avoids building the intermediate node objects.
+        """
+        if not isinstance(indices, np.ndarray): indices = np.fromiter(indices, dtype=Int)
+        return self._coordinates[indices]
+
     def getElements(self, indices: Iterable[int]) -> Tuple[Element]:
         """Returns the elements associated with the given indices."""
         return itemgetter(*indices)(self.elements)
+
+    def reverseCuthillMcKee(self) -> IntVector:
+        """
+        Returns a bandwidth-reducing node ordering computed by the reverse Cuthill-McKee algorithm, applied to the node
+        adjacency graph of the mesh (two nodes are adjacent if they share an element). The returned vector maps each new
+        node index to the corresponding (old) node index.
+        """
+        # build node adjacency graph (CSR format) from the connectivity of elements with the same number of nodes
+        m: int = self.nodeCount
+        rows: list[IntVector] = []
+        columns: list[IntVector] = []
+        for nodeCount, (_, connectivity) in self.connectivities.items():
+            connectivity = connectivity.astype(np.int64)
+            rows.append(np.repeat(connectivity, nodeCount, axis=1).reshape(-1))
+            columns.append(np.tile(connectivity, (1, nodeCount)).reshape(-1))
+        pairs: IntVector = np.unique(np.concatenate(rows)*m + np.concatenate(columns))
+        pairs = pairs[pairs//m != pairs%m]
+        adjacency: IntVector = (pairs%m).astype(Int)
+        pointers: IntVector = np.zeros(shape=(m + 1,), dtype=np.int64)
+        np.cumsum(np.bincount(pairs//m, minlength=m), out=pointers[1:])
+        degrees: IntVector = np.diff(pointers)
+
+        # level structure rooted at the specified node (the levels of a breadth-first search)
+        marked: npt.NDArray[np.bool_] = np.zeros(shape=(m,), dtype=bool)
+        def rootedLevels(root: int) -> list[IntVector]:
+            levels: list[IntVector] = [np.array((root,), dtype=np.int64)]
+            marked[root] = True
+            while True:
+                counts: IntVector = degrees[levels[-1]]
+                offsets: IntVector = np.repeat(pointers[levels[-1]] - np.cumsum(counts) + counts, counts)
+                neighbors: IntVector = np.unique(adjacency[offsets + np.arange(offsets.size)])
+                neighbors = neighbors[~marked[neighbors]]
+                if neighbors.size == 0: break
+                marked[neighbors] = True
+                levels.append(neighbors)
+            for level in levels: marked[level] = False
+            return levels
+
+        # breadth-first search of each connected component, starting at a pseudo-peripheral node (George-Liu)
+        # neighbors are visited by increasing degree
+        order: IntVector = np.empty(shape=(m,), dtype=Int)
+        visited: npt.NDArray[np.bool_] = np.zeros(shape=(m,), dtype=bool)
+        head: int = 0
+        tail: int = 0
+        for start in np.argsort(degrees, kind="stable").tolist():
+            if visited[start]: continue
+            levels: list[IntVector] = rootedLevels(start)
+            while True:
+                candidate: int = int(levels[-1][np.argmin(degrees[levels[-1]])])
+                candidateLevels: list[IntVector] = rootedLevels(candidate)
+                if len(candidateLevels) <= len(levels): break
+                start, levels = candidate, candidateLevels
+            visited[start] = True
+            order[tail] = start
+            tail += 1
+            while head < tail:
+                node: int = order[head]
+                head += 1
+                neighbors: IntVector = adjacency[pointers[node]:pointers[node + 1]]
+                neighbors = neighbors[~visited[neighbors]]
+                neighbors = neighbors[np.argsort(degrees[neighbors], kind="stable")]
+                visited[neighbors] = True
+                order[tail:tail + neighbors.size] = neighbors
+                tail += neighbors.size
+
+        # reverse
+        return order[::-1].copy()
@@ -1,6 +1,7 @@
+import numpy as np
 from enum import Enum, unique
 from collections.abc import Iterable
-from feapack.typing import Float3D
+from feapack.typing import Float3D, Real, RealMatrix
 
 @unique
 class ModelingSpaces(Enum):
@@ -16,13 +17,12 @@ class ModelingSpaces(Enum):
     "Three-dimensional modeling space."
 
     @staticmethod
-    def fromCoordinates(coordinates: Iterable[Float3D]) -> "ModelingSpaces":
-        """Determines the modeling space from an iterable of nodal coordinates."""
-        count: int = 0
-        for dim in range(3):
-            for xyz in coordinates:
-                if xyz[dim] != 0.0:
-                    count += 1
-                    break
+    def fromCoordinates(coordinates: Iterable[Float3D] | RealMatrix) -> "ModelingSpaces":
+        """
+        Determines the modeling space from an iterable of nodal coordinates (or a matrix with one row per node), i.e.,
+        the number of global axes along which at least one nodal coordinate is nonzero.
+        """
+        if not isinstance(coordinates, np.ndarray): coordinates = np.array([*coordinates], dtype=Real)
+        count: int = int(np.count_nonzero(np.any(coordinates.reshape(-1, 3) != 0.0, axis=0)))
         if count not in (1, 2, 3): raise ValueError("unexpected modeling space")
         return ModelingSpaces(count)
@@ -1,3 +1,4 @@
+import numpy as np
 from collections.abc import Iterable
 from feapack.typing import IntTuple
 
@@ -18,5 +19,8 @@ class NodeSet:
         """
         Creates a new node index set containing the specified indices.
         Duplicate indices are removed and the index set is sorted.
+        The indices may also be given as an array (or a view of an array), which is not modified.
         """
-        self._indices: IntTuple = tuple(sorted(set(indices)))
+        # arrays are deduplicated and sorted by numpy in a single call (no intermediate set of boxed integers)
+        if isinstance(indices, np.ndarray): self._indices: IntTuple = tuple(np.unique(indices).tolist())
+        else: self._indices: IntTuple = tuple(sorted(set(indices)))
@@ -1,13 +1,15 @@
 import os
+import numpy as np
+from io import TextIOWrapper
 from typing import Literal
-from collections.abc import Mapping, Iterable, Sequence
+from collections.abc import Mapping, Iterable, Iterator, Sequence
 from feapack.model import MissingFrameError, ElementTypes, Mesh
-from feapack.typing import Float3D, IntTuple
+from feapack.typing import Float3D, IntTuple, Int, Real, RealVector, RealMatrix
 
 class ODB:
     """Definition of an output database (ODB)."""
 
-    __slots__ = ("_filePath", "_mode", "_frameCount", "_currentFrame", "_linePointers")
+    __slots__ = ("_filePath", "_mode", "_frameCount", "_currentFrame", "_linePointers", "_titlesCache", "_file")
 
     @property
     def filePath(self) -> str:
@@ -30,13 +32,19 @@ class ODB:
         return self._frameCount
 
     def __init__(self, filePath: str, mode: Literal["read", "write"], replace: bool = False) -> None:
-        """Creates a new output database object associated with the specified file."""
+        """
+        Creates a new output database object associated with the specified file.
+        In read-only mode, the file is kept open until the output database is closed (see `close`), e.g., by using the
+        output database in a `with` block.
+        """
         # instance variables
+        self._file: TextIOWrapper | None = None
         self._filePath: str = filePath
         self._mode: Literal["r", "a"] = "a" if mode == "write" else "r"
         self._frameCount: int = 0
         self._currentFrame: int = -1
-        self._linePointers: list[dict[str, tuple[str, int]]] = []
+        self._linePointers: list[dict[str, tuple[int, int]]] = []
+        self._titlesCache: dict[tuple[int, str], tuple[str, ...]] = {}
 
         # if replacing is intended, check for read-only mode
         if replace and os.path.isfile(filePath):
@@ -51,34 +59,57 @@ class ODB:
         if mode == "read" and not os.path.isfile(filePath):
             raise ValueError(f"output database not found: '{filePath}'")
 
-        # if read-only mode, count number of frames
+        # if read-only mode, determine pointers pointing to command lines, e.g., $NODES, for each frame
+        # these pointers are used for jumping to specific lines in the file
+        # each pointer is stored along with the count given in its command line, e.g., the number of nodes for $NODES
+        # the frames are counted in the same (single) pass over the file, in order of appearance
         if mode == "read":
-            with open(self._filePath, self._mode) as file:
-                for line in file:
-                    if line.strip() == "$FRAME":
-                        self._frameCount += 1
-            if self._frameCount == 0: raise MissingFrameError(f"output database has no frames: '{filePath}'")
+            # the file is opened once and kept open, all getters seek into this same file
+            self._file = file = open(self._filePath, self._mode)
+            d: dict[str, tuple[int, int]] | None = None
+            while line := file.readline():
+                if not line.startswith("$"): continue
+                line = line.strip()
+                if line == "$FRAME":
+                    file.readline() # frame number
+                    d = {}
+                    self._linePointers.append(d)
+                    continue
+                elif line == "$END_FRAME":
+                    d = None
+                    continue
+                if d is not None:
+                    command, _, count = line.partition(" ")
+                    d[command] = int(count) if count else 0, file.tell()
+            self._frameCount = len(self._linePointers)
+            if self._frameCount == 0:
+                self.close()
+                raise MissingFrameError(f"output database has no frames: '{filePath}'")
             self._currentFrame = self._frameCount - 1
 
-        # if read-only mode, determine pointers pointing to command lines, e.g., $NODES
-        # these pointers are used for jumping to specific lines in the file
-        if mode == "read":
-            self._linePointers = [{} for _ in range(self._frameCount)]
-            d: dict[str, tuple[str, int]] | None = None
-            with open(self._filePath, self._mode) as file:
-                while line := file.readline():
-                    if not line.startswith("$"): continue
-                    line = line.strip()
-                    if line == "$FRAME":
-                        frame: int = int(file.readline())
-                        d = self._linePointers[frame]
-                        continue
-                    elif line == "$END_FRAME":
-                        d = None
-                        continue
-                    if d is not None:
-                        command: str = line.split(" ", maxsplit=1)[0]
-                        d[command] = line, file.tell()
+    def __enter__(self) -> "ODB":
+        """Enters a `with` block, e.g., `with ODB(filePath, mode="read") as odb: ...`, returning this object."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Exits a `with` block, closing the file (see `close`)."""
+        self.close()
+
+    def __del__(self) -> None:
+        """Closes the file (if still open) when the output database object is garbage collected."""
+        self.close()
+
+    def close(self) -> None:
+        """Closes the file associated with the output database (only relevant in read-only mode)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _seek(self, pointer: int) -> TextIOWrapper:
+        """Moves the position of the (already open) file to the specified pointer and returns the file."""
+        if self._file is None: raise RuntimeError("output database is closed or not in read-only mode")
+        self._file.seek(pointer)
+        return self._file
 
     def writeNextFrame(
         self, description: str, mesh: Mesh, nodeOutput: Mapping[str, Iterable[float]] = {},
@@ -97,14 +128,14 @@ class ODB:
 
             # nodes
             file.write(f"$NODES {mesh.nodeCount}\n")
-            for node in mesh.nodes:
-                file.write(f"{node.x}, {node.y}, {node.z}\n")
+            file.writelines(f"{x}, {y}, {z}\n" for x, y, z in mesh.coordinates.tolist())
             file.write("\n")
 
             # elements
             file.write(f"$ELEMENTS {mesh.elementCount}\n")
-            for element in mesh.elements:
-                file.write(f"{element.type.name}, {", ".join(map(str, element.nodeIndices))}\n")
+            file.writelines(
+                f"{element.type.name}, {", ".join(map(str, element.nodeIndices))}\n" for element in mesh.elements
+            )
             file.write("\n")
 
             # node output titles
@@ -115,8 +146,13 @@ class ODB:
 
             # node output values
             file.write(f"$NODE_OUTPUT_VALUES {mesh.nodeCount if len(nodeOutput) > 0 else 0}\n")
-            for row in zip(*nodeOutput.values()):
-                file.write(f"{", ".join(map(str, row))}\n")
+            # (the output columns are stacked into a single matrix, which is then formatted row by row)
+            if len(nodeOutput) > 0:
+                values: RealMatrix = np.column_stack([
+                    np.asarray(column, dtype=Real) if isinstance(column, np.ndarray | Sequence) else
+                    np.fromiter(column, dtype=Real) for column in nodeOutput.values()
+                ])
+                file.writelines(f"{", ".join(map(str, row))}\n" for row in values.tolist())
             file.write("\n")
 
             # global output titles
@@ -136,71 +172,101 @@ class ODB:
 
     def getDescription(self) -> str:
         """Gets the description from file for the current output frame."""
-        pointer = self._linePointers[self._currentFrame]["$DESCRIPTION"][1]
-        with open(self._filePath, self._mode) as file:
-            file.seek(pointer)
-            return file.readline().strip()
+        pointer: int = self._linePointers[self._currentFrame]["$DESCRIPTION"][1]
+        return self._seek(pointer).readline().strip()
 
     def getNodes(self) -> Iterable[Float3D]:
         """Gets the nodal coordinates from file for the current output frame."""
-        line, pointer = self._linePointers[self._currentFrame]["$NODES"]
-        nodeCount: int = int(line.split(" ")[1])
-        with open(self._filePath, self._mode) as file:
-            file.seek(pointer)
-            for _ in range(nodeCount):
-                line = file.readline()
-                coordinates: list[float] = [float(x) for x in line.split(",")]
-                yield (coordinates[0], coordinates[1], coordinates[2])
+        nodeCount, pointer = self._linePointers[self._currentFrame]["$NODES"]
+        if nodeCount == 0: return
+        file: TextIOWrapper = self._seek(pointer)
+        coordinates: RealMatrix = np.loadtxt(file, dtype=Real, delimiter=",", max_rows=nodeCount, ndmin=2)
+        for x, y, z in coordinates.tolist(): yield x, y, z
 
     def getElements(self) -> Iterable[tuple[ElementTypes, IntTuple]]:
         """Gets the element types and corresponding nodal connectivity from file for the current output frame."""
-        line, pointer = self._linePointers[self._currentFrame]["$ELEMENTS"]
-        elementCount: int = int(line.split(" ")[1])
-        with open(self._filePath, self._mode) as file:
-            file.seek(pointer)
-            for _ in range(elementCount):
-                line = file.readline()
-                type, connectivity = line.split(",", maxsplit=1)
-                yield ElementTypes[type], tuple(int(x) for x in connectivity.split(","))
+        elementCount, pointer = self._linePointers[self._currentFrame]["$ELEMENTS"]
+        # (the whole block is read before yielding, since the file is shared by all getters)
+        file: TextIOWrapper = self._seek(pointer)
+        types: list[str] = []
+        records: dict[str, list[str]] = {}
+        for _ in range(elementCount):
+            type, connectivity = file.readline().split(",", maxsplit=1)
+            types.append(type)
+            records.setdefault(type, []).append(connectivity)
+
+        # the connectivity records of each element type have the same number of fields, parsed by a single call per type
+        # the elements are then yielded in their original order
+        elementTypes: dict[str, ElementTypes] = {type: ElementTypes[type] for type in records}
+        connectivities: dict[str, Iterator[list[int]]] = {
+            type: iter(np.loadtxt(records[type], dtype=Int, delimiter=",", ndmin=2).tolist()) for type in records
+        }
+        for type in types:
+            yield elementTypes[type], tuple(next(connectivities[type]))
+
+    def _getTitles(self, command: str) -> tuple[str, ...]:
+        """
+        Gets the output titles under the specified command, e.g., `$NODE_OUTPUT_TITLES`, from file for the current
+        output frame. The titles are read once per frame and command, and then cached.
+        """
+        key: tuple[int, str] = self._currentFrame, command
+        if key not in self._titlesCache:
+            count, pointer = self._linePointers[self._currentFrame][command]
+            file: TextIOWrapper = self._seek(pointer)
+            self._titlesCache[key] = tuple(file.readline().strip() for _ in range(count))
+        return self._titlesCache[key]
 
     def getNodeOutputTitles(self) -> Iterable[str]:
         """Gets the node output titles from file for the current output frame."""
-        line, pointer = self._linePointers[self._currentFrame]["$NODE_OUTPUT_TITLES"]
-        count: int = int(line.split(" ")[1])
-        with open(self._filePath, self._mode) as file:
-            file.seek(pointer)
-            for _ in range(count):
-                yield file.readline().strip()
+        return self._getTitles("$NODE_OUTPUT_TITLES")
 
     def getGlobalOutputTitles(self) -> Iterable[str]:
         """Gets the global output titles from file for the current output frame."""
-        line, pointer = self._linePointers[self._currentFrame]["$GLOBAL_OUTPUT_TITLES"]
-        count: int = int(line.split(" ")[1])
-        with open(self._filePath, self._mode) as file:
-            file.seek(pointer)
-            for _ in range(count):
-                yield file.readline().strip()
+        return self._getTitles("$GLOBAL_OUTPUT_TITLES")
 
     def getNodeOutputValues(self, title: str) -> Iterable[float]:
         """Gets the node output values from file for the current output frame."""
-        index: int = [*self.getNodeOutputTitles()].index(title)
-        line, pointer = self._linePointers[self._currentFrame]["$NODE_OUTPUT_VALUES"]
-        count: int = int(line.split(" ")[1])
-        with open(self._filePath, self._mode) as file:
-            file.seek(pointer)
-            for _ in range(count):
-                yield float(file.readline().split(",", maxsplit=index + 1)[index])
+        index: int = self._getTitles("$NODE_OUTPUT_TITLES").index(title)
+        count, pointer = self._linePointers[self._currentFrame]["$NODE_OUTPUT_VALUES"]
+        # (the whole block is read before yielding, since the file is shared by all getters)
+        file: TextIOWrapper = self._seek(pointer)
+        lines: list[str] = [file.readline() for _ in range(count)]
+        for line in lines:
+            yield float(line.split(",", maxsplit=index + 1)[index])
+
+    def getNodeOutputArray(self, title: str, out: RealVector | None = None) -> RealVector:
+        """
+        Gets the node output values from file for the current output frame as an array.
+        If `out` is given, the values are written into this (preallocated) array, which is then returned.
+        """
+        index: int = self._getTitles("$NODE_OUTPUT_TITLES").index(title)
+        count, pointer = self._linePointers[self._currentFrame]["$NODE_OUTPUT_VALUES"]
+        if out is not None and out.shape != (count,): raise ValueError(f"'out' must be a vector of size {count}")
+        if count == 0: return np.empty(0, dtype=Real) if out is None else out
+        file: TextIOWrapper = self._seek(pointer)
+        values: RealVector = np.loadtxt(file, dtype=Real, delimiter=",", usecols=index, max_rows=count, ndmin=1)
+        if out is None: return values
+        out[:] = values
+        return out
+
+    def getNodeOutputMatrix(self) -> RealMatrix:
+        """
+        Gets all node output values from file for the current output frame as a matrix, i.e., the whole block is read
+        in a single pass. Each row corresponds to a node and each column to a node output title (in the same order).
+        """
+        count, pointer = self._linePointers[self._currentFrame]["$NODE_OUTPUT_VALUES"]
+        titleCount: int = len(self._getTitles("$NODE_OUTPUT_TITLES"))
+        if count == 0 or titleCount == 0: return np.empty(shape=(count, titleCount), dtype=Real)
+        return np.loadtxt(self._seek(pointer), dtype=Real, delimiter=",", max_rows=count, ndmin=2)
 
     def getGlobalOutputValues(self, title: str) -> float:
         """Gets the global output values from file for the current output frame."""
-        index: int = [*self.getGlobalOutputTitles()].index(title)
-        line, pointer = self._linePointers[self._currentFrame]["$GLOBAL_OUTPUT_VALUES"]
-        count: int = int(line.split(" ")[1])
-        with open(self._filePath, self._mode) as file:
-            file.seek(pointer)
-            for i in range(count):
-                line = file.readline()
-                if i == index: return float(line)
+        index: int = self._getTitles("$GLOBAL_OUTPUT_TITLES").index(title)
+        count, pointer = self._linePointers[self._currentFrame]["$GLOBAL_OUTPUT_VALUES"]
+        file: TextIOWrapper = self._seek(pointer)
+        for i in range(count):
+            line = file.readline()
+            if i == index: return float(line)
         return float("nan")
 
     def goToFirstFrame(self) -> None:
@@ -227,16 +293,20 @@ class ODB:
         self._currentFrame = frame
 
     @staticmethod
-    def merge(filePath: str, selection: Iterable[tuple[str, Iterable[int]]], descriptions: Sequence[str] = (), deleteExisting: bool = False) -> None:
+    def merge(
+        filePath: str, selection: Iterable[tuple[str, Iterable[int]]], descriptions: Iterable[str] = (),
+        deleteExisting: bool = False
+    ) -> None:
         """
         Merges multiple frames from multiple ODBs into a single ODB file. The parameter `filePath` specifies the file
         path for the new ODB file. If an ODB already exists, it will be replaced. The parameter `selection` specifies
         the existing ODBs and corresponding frames, e.g.,
         `selection=(('my_odb_1.out', (1, 2, 3)), ('my_odb_2.out', (4, 5)))` will merge frames 1, 2, and 3 from
         'my_odb_1.out' and frames 4 and 5 from 'my_odb_2.out' into a single ODB file. The `descriptions` parameter
-        (optional) specifies a sequence of descriptions that override the descriptions of the frames. The
-        `deleteExisting` parameter (optional) specifies if the existing ODB files should be deleted. By default, they
-        are not deleted.
+        (optional) specifies the descriptions that override the descriptions of the frames; frames without a
+        corresponding description keep their own. The `deleteExisting` parameter (optional) specifies if the existing
+        ODB files should be deleted. By default, they are not deleted. Both `selection` and `descriptions` are consumed
+        lazily, in a single pass, hence these may be generators.
         """
         # delete previous ODB file
         if os.path.isfile(filePath): os.remove(filePath)
@@ -245,20 +315,26 @@ class ODB:
         new: ODB = ODB(filePath, mode="write")
 
         # append frames from existing ODBs
-        count: int = 0
+        oldFilePaths: dict[str, None] = {}
+        descriptionIterator: Iterator[str] = iter(descriptions)
         for oldFilePath, frames in selection:
-            old: ODB = ODB(oldFilePath, mode="read")
-            for frame in frames:
-                old.goToFrame(frame)
-                new.writeNextFrame(
-                    description=old.getDescription() if not descriptions else descriptions[count],
-                    mesh=Mesh(nodes=old.getNodes(), elements=old.getElements()),
-                    nodeOutput={title: old.getNodeOutputValues(title) for title in old.getNodeOutputTitles()},
-                    globalOutput={title: old.getGlobalOutputValues(title) for title in old.getGlobalOutputTitles()}
-                )
-                count += 1
+            with ODB(oldFilePath, mode="read") as old:
+                for frame in frames:
+                    old.goToFrame(frame)
+                    description: str | None = next(descriptionIterator, None)
+                    # (the node output values are read once per frame, as a matrix, and passed column by column)
+                    nodeOutputValues: RealMatrix = old.getNodeOutputMatrix()
+                    new.writeNextFrame(
+                        description=old.getDescription() if description is None else description,
+                        mesh=Mesh(nodes=old.getNodes(), elements=old.getElements()),
+                        nodeOutput={
+                            title: nodeOutputValues[:, i] for i, title in enumerate(old.getNodeOutputTitles())
+                        },
+                        globalOutput={title: old.getGlobalOutputValues(title) for title in old.getGlobalOutputTitles()}
+                    )
+            oldFilePaths[oldFilePath] = None
 
         # delete old ODB files if requested
         if deleteExisting:
-            for oldFilePath, _ in selection:
+            for oldFilePath in oldFilePaths:
                 os.remove(oldFilePath)
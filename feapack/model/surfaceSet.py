@@ -1,5 +1,6 @@
+import numpy as np
 from collections.abc import Iterable
-from feapack.typing import Int2D, Tuple
+from feapack.typing import Int2D, Tuple, IntMatrix
 
 class SurfaceSet:
     """
@@ -17,12 +18,19 @@ class SurfaceSet:
         """The indices in the set."""
         return self._indices
 
-    def __init__(self, indices: Iterable[Int2D]) -> None:
+    def __init__(self, indices: Iterable[Int2D] | IntMatrix) -> None:
         """
         Creates a new surface index set containing the specified indices.
         Duplicate indices are removed and the index set is sorted.
         Each index of the set is a tuple that contains:
         1. The global index of the element that contains the surface.
         2. The local index of the element surface.
+        The indices may also be given as an array with two columns, which is not modified.
         """
+        # arrays are deduplicated and sorted (row by row) by numpy in a single call
+        if isinstance(indices, np.ndarray):
+            self._indices: Tuple[Int2D] = tuple(
+                (index, surfaceIndex) for index, surfaceIndex in np.unique(indices.reshape(-1, 2), axis=0).tolist()
+            )
+            return
         self._indices: Tuple[Int2D] = tuple(sorted(set(indices)))
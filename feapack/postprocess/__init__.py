@@ -0,0 +1 @@
+from .fracture import vcct as vcct
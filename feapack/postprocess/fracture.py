@@ -0,0 +1,25 @@
+import numpy as np
+from feapack.typing import IntVector, RealVector, RealMatrix
+
+def vcct(Fy: RealMatrix, Uy: RealMatrix, tips: IntVector, da: RealVector, thickness: float, young: float) -> RealVector:
+    """
+    Computes mode I stress intensity factors via the virtual crack closure technique (VCCT), for a symmetric model of a
+    crack propagating along the X axis, in which crack nodes are released one step at a time. Row `i` of `Fy` and `Uy`
+    contains the nodal Y reaction forces and Y displacements of step `i`; `tips[i]` is the crack tip node index of step
+    `i` and `da[i]` is the crack extension from step `i` to step `i + 1`. Returns one stress intensity factor per crack
+    tip, computed from the closing force of step `i` and the opening displacement of step `i + 1`.
+    """
+    # check arguments
+    n: int = tips.size
+    if da.shape != (n,): raise ValueError("'tips' and 'da' must be vectors of the same size")
+    if Fy.shape != Uy.shape or Fy.ndim != 2 or Fy.shape[0] < n + 1:
+        raise ValueError(f"'Fy' and 'Uy' must be matrices of the same shape with at least {n + 1} rows")
+
+    # gather closing forces and opening displacements at the crack tips
+    steps: IntVector = np.arange(n)
+    fy: RealVector = Fy[steps, tips]
+    uy: RealVector = Uy[steps + 1, tips]
+
+    # energy release rates and stress intensity factors (plane stress)
+    G: RealVector = -(2.0*uy*fy)/(2.0*thickness*da)
+    return np.sqrt(G*young)
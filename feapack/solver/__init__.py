@@ -1,2 +1,4 @@
-from .sparseCSR import SparseCSR as SparseCSR
-from .main      import solve     as solve
+from .sparseCSR           import SparseCSR           as SparseCSR
+from .sparseFactorization import SparseFactorization as SparseFactorization
+from .main                import solve               as solve
+from .main                import solveSeries         as solveSeries
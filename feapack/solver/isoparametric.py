@@ -1,6 +1,6 @@
 import numpy as np
 import feapack.solver.linearAlgebra as linalg
-from feapack.typing import Real, RealVector, RealMatrix
+from feapack.typing import Real, RealVector, RealMatrix, RealTensor
 from feapack.model import Element, Surface, ElementTypes, SectionTypes, ModelingSpaces
 from typing import Literal
 
@@ -735,6 +735,46 @@ def evaluateElement(element: Element, X: RealMatrix, intPt: RealVector, weight:
     # done
     return coord, N, Nx, vol
 
+def evaluateElements(element: Element, X: RealTensor, intPt: RealVector, weight: float) -> \
+    tuple[RealMatrix, RealVector, RealTensor, RealVector]:
+    """
+    Batched version of `evaluateElement` for multiple elements sharing the same type and section as the specified
+    element. The nodal coordinate matrices `X` are stacked along the first axis (one matrix per element). Returns the
+    same items stacked along the first axis, except for the shape functions, which are the same for all elements.
+    """
+    # modeling space
+    k: int = element.modelingSpace.value
+
+    # evaluate shape functions and their natural derivatives at the specified integration point
+    N: RealVector = shapeFunctions(element, intPt[0], intPt[1], intPt[2])
+    Nr: RealMatrix = naturalDerivatives(element, intPt[0], intPt[1], intPt[2])
+
+    # compute physical coordinates of the integration point
+    coord: RealMatrix = np.matmul(N, X)
+
+    # compute the Jacobians
+    J: RealTensor = np.matmul(Nr[:k, :], X[:, :, :k])
+    detJ: RealVector = np.linalg.det(J)
+    if np.any(detJ == 0.0): raise ValueError("matrix is singular")
+    invJ: RealTensor = np.linalg.inv(J)
+
+    # compute physical derivatives of the shape functions
+    Nx: RealTensor = np.zeros(shape=(X.shape[0], *Nr.shape), dtype=Real)
+    Nx[:, :k, :] = np.matmul(invJ, Nr[:k, :])
+
+    # integration point volumes
+    vol: RealVector
+    match element.section.type:
+        case SectionTypes.PlaneStress | SectionTypes.PlaneStrain:
+            vol = weight*np.abs(detJ)*element.section.thickness
+        case SectionTypes.Axisymmetric:
+            vol = weight*np.abs(detJ)*2.0*np.pi*coord[:, 0]
+        case SectionTypes.General:
+            vol = weight*np.abs(detJ)
+
+    # done
+    return coord, N, Nx, vol
+
 def evaluateSurface(surface: Surface, X: RealMatrix, intPt: RealVector, weight: float) -> \
     tuple[RealVector, RealVector, RealVector, float]:
     """
@@ -3,7 +3,7 @@ import numpy.ctypeslib as npc
 import feapack.c.libmkl as mkl
 from ctypes import byref
 from typing import Literal, overload
-from feapack.solver import SparseCSR
+from feapack.solver import SparseCSR, SparseFactorization
 from feapack.typing import Real, RealVector, RealMatrix
 
 def determinant(A: RealMatrix) -> float:
@@ -90,12 +90,15 @@ def inverse(A: RealMatrix) -> tuple[RealMatrix, float]:
 
 @overload
 def spmatmul(
-    A: SparseCSR, x: RealVector, y: RealVector, alpha: float = 1.0, beta: float = 1.0, transposeA: bool = False
+    A: SparseCSR, x: RealVector | RealMatrix, y: RealVector | RealMatrix, alpha: float = 1.0, beta: float = 1.0,
+    transposeA: bool = False
 ) -> None:
     """
     Computes a sparse matrix-vector product. Performed in-place, defined as `y <- alpha*op(A)*x + beta*y`, where `alpha`
     and `beta` are scalars, `x` and `y` are vectors, and `A` is a sparse matrix. Additionally, `op(A) = A` or
-    `op(A) = transpose(A)`.
+    `op(A) = transpose(A)`. If `x` and `y` are matrices, each column is a vector, and the product is computed for all
+    columns in a single traversal of `A`. No memory is allocated for the output, hence `y` may be a preallocated buffer
+    that is reused between calls (`beta=0.0` overwrites its contents).
     """
     ...
 
@@ -109,178 +112,92 @@ def spmatmul(
     """
     ...
 
+@overload
 def spmatmul(
-    A: SparseCSR, x: RealVector, y: RealVector | None = None, alpha: float = 1.0, beta: float | None = None,
-    transposeA: bool = False
-) -> RealVector | None:
-    # allocate output vector if necessary
+    A: SparseCSR, x: RealMatrix, y: None = None, alpha: float = 1.0, beta: None = None, transposeA: bool = False
+) -> RealMatrix:
+    """
+    Computes sparse matrix-vector products for multiple vectors (the columns of `x`). Defined as `y <- alpha*op(A)*x`,
+    where `alpha` is a scalar, `x` and `y` are matrices, and `A` is a sparse matrix. Additionally, `op(A) = A` or
+    `op(A) = transpose(A)`. The products are computed for all columns in a single traversal of `A`.
+    """
+    ...
+
+def spmatmul(
+    A: SparseCSR, x: RealVector | RealMatrix, y: RealVector | RealMatrix | None = None, alpha: float = 1.0,
+    beta: float | None = None, transposeA: bool = False
+) -> RealVector | RealMatrix | None:
+    # allocate output vector (or matrix) if necessary
     if y is None:
-        y = np.zeros(shape=(A.rowCount if not transposeA else A.columnCount,), dtype=Real)
+        y = np.zeros(shape=(A.rowCount if not transposeA else A.columnCount, *x.shape[1:]), dtype=Real)
         spmatmul(A, x, y, alpha, 1.0, transposeA)
         return y
 
     # check arguments
     m: int = A.rowCount if not transposeA else A.columnCount
     n: int = A.columnCount if not transposeA else A.rowCount
-    if x.ndim != 1 or x.shape[0] != n: raise ValueError(f"'x' must be a vector of size {n}")
-    if y.ndim != 1 or y.shape[0] != m: raise ValueError(f"'y' must be a vector of size {m}")
+    if x.ndim not in (1, 2) or x.shape[0] != n: raise ValueError(f"'x' must be a vector or a matrix with {n} rows")
+    if y.shape != (m, *x.shape[1:]): raise ValueError(f"'y' must have shape {(m, *x.shape[1:])}")
+    if y.dtype != Real or not y.flags.c_contiguous: raise ValueError("'y' must be a C-contiguous array of reals")
     if beta is None: beta = 1.0
 
+    # the external routine requires a C-contiguous input (a copy is made only if necessary, e.g., strided views)
+    x = np.ascontiguousarray(x, dtype=Real)
+
     # call external computational routine
-    status: int = mkl.mkl_sparse_d_mv(
-        mkl.SPARSE_OPERATION_NON_TRANSPOSE if not transposeA else mkl.SPARSE_OPERATION_TRANSPOSE,
-        alpha,
-        A.internalPointer,
-        A.description,
-        npc.as_ctypes(x),
-        beta,
-        npc.as_ctypes(y)
-    )
+    # the arrays are passed as typed data pointers, which avoids building a ctypes array object for each array
+    operation: int = mkl.SPARSE_OPERATION_NON_TRANSPOSE if not transposeA else mkl.SPARSE_OPERATION_TRANSPOSE
+    match x.ndim:
+        case 1:
+            status: int = mkl.mkl_sparse_d_mv(
+                operation,
+                alpha,
+                A.internalPointer,
+                A.description,
+                x.ctypes.data_as(mkl.c_double_p),
+                beta,
+                y.ctypes.data_as(mkl.c_double_p)
+            )
+        case _:
+            # matrices are stored in row-major order, hence the leading dimensions are the number of columns
+            columns: int = x.shape[1]
+            status: int = mkl.mkl_sparse_d_mm(
+                operation,
+                alpha,
+                A.internalPointer,
+                A.description,
+                mkl.SPARSE_LAYOUT_ROW_MAJOR,
+                x.ctypes.data_as(mkl.c_double_p),
+                columns,
+                columns,
+                beta,
+                y.ctypes.data_as(mkl.c_double_p),
+                columns
+            )
     if status != mkl.SPARSE_STATUS_SUCCESS:
         raise RuntimeError("external computational error")
 
+@overload
 def spsolve(A: SparseCSR, B: RealVector, _mtype: int = 11) -> RealVector:
     """Calculates the solution of a set of sparse linear equations."""
-    # check arguments
-    if A.rowCount != A.columnCount: raise ValueError("'A' must be a square sparse matrix")
-    if B.ndim != 1 or B.shape[0] != A.rowCount: raise ValueError(f"'B' must be a vector of size {A.rowCount}")
-
-    # allocate solution vector
-    X: RealVector = np.zeros(shape=B.shape, dtype=Real)
-
-    # unpack CSR3-type data
-    values, columns, rowIndex = A.CSR3
-
-    # solver internal data address pointer
-    pt = npc.as_ctypes(np.zeros(shape=(64,), dtype=np.int64))
-
-    # maximal number of factors in memory
-    maxfct = mkl.c_int(1)
-
-    # the number of matrix to solve
-    mnum = mkl.c_int(1)
-
-    # matrix type
-    #  1: real and structurally symmetric
-    #  2: real and symmetric positive definite
-    # -2: real and symmetric indefinite
-    #  3: complex and structurally symmetric
-    #  4: complex and Hermitian positive definite
-    # -4: complex and Hermitian indefinite
-    #  6: complex and symmetric matrix
-    # 11: real and non-symmetric matrix
-    # 13: complex and non-symmetric matrix
-    mtype = mkl.c_int(_mtype)
-
-    # controls the execution of the solver
-    #  11: analysis
-    #  12: analysis, numerical factorization
-    #  13: analysis, numerical factorization, solve, iterative refinement
-    #  22: numerical factorization
-    #  23: numerical factorization, solve, iterative refinement
-    #  33: solve, iterative refinement
-    # 331: like phase=33, but only forward substitution
-    # 332: like phase=33, but only diagonal substitution
-    # 333: like phase=33, but only backward substitution
-    #   0: release internal memory for L and U of the matrix number mnum
-    #  -1: release all internal memory for all matrices
-    phase = mkl.c_int(13)
-
-    # number of equations in the sparse linear system
-    n = mkl.c_int(A.rowCount)
-
-    # non-zero elements of the coefficient matrix
-    a = npc.as_ctypes(values)
-
-    # rowIndex array in CSR3 format
-    ia = npc.as_ctypes(rowIndex)
-
-    # columns array in CSR3 format
-    ja = npc.as_ctypes(columns)
-
-    # the permutation vector
-    perm = (mkl.c_int*A.rowCount)()
-
-    # number of right-hand sides
-    nrhs = mkl.c_int(1)
-
-    # Intel oneMKL PARDISO parameters
-    iparm = (mkl.c_int*64)()
-    iparm[0]     = 1
-    iparm[1]     = 3
-    iparm[2]     = 0
-    iparm[3]     = 0
-    iparm[4]     = 0
-    iparm[5]     = 0
-    iparm[6]     = 0
-    iparm[7]     = 0
-    iparm[8]     = 0
-    iparm[9]     = 13 if _mtype in (11, 13) else 8 if _mtype in (-2, -4, 6) else 0
-    iparm[10]    = 1 if _mtype in (11, 13) else 0
-    iparm[11]    = 0
-    iparm[12]    = 1 if _mtype in (11, 13) else 0
-    iparm[13:17] = 0, 0, 0, 0
-    iparm[17]    = -1
-    iparm[18]    = 0
-    iparm[19]    = 0
-    iparm[20]    = 1
-    iparm[21:23] = 0, 0
-    iparm[23]    = 0
-    iparm[24]    = 0
-    iparm[25]    = 0
-    iparm[26]    = 0
-    iparm[27]    = 0
-    iparm[28]    = 0
-    iparm[29]    = 0
-    iparm[30]    = 0
-    iparm[31:33] = 0, 0
-    iparm[33]    = 0
-    iparm[34]    = 1
-    iparm[35]    = 0
-    iparm[36]    = 0
-    iparm[37]    = 0
-    iparm[38]    = 0
-    iparm[39:42] = 0, 0, 0
-    iparm[42]    = 0
-    iparm[43:55] = 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
-    iparm[55]    = 0
-    iparm[56:59] = 0, 0, 0
-    iparm[59]    = 0
-    iparm[60:62] = 0, 0
-    iparm[62]    = 0
-    iparm[63]    = 0
-
-    # message level information
-    msglvl = mkl.c_int(0)
-
-    # right-hand side vectors
-    b = npc.as_ctypes(B)
-
-    # solution vectors
-    x = npc.as_ctypes(X)
-
-    # error indicator
-    error = mkl.c_int(1)
+    ...
 
-    # call computational routine
-    mkl.pardiso(
-        pt, byref(maxfct), byref(mnum), byref(mtype), byref(phase), byref(n), a, ia, ja, perm, byref(nrhs), iparm,
-        byref(msglvl), b, x, byref(error)
-    )
-    if error.value != 0:
-        raise RuntimeError("external computational error")
+@overload
+def spsolve(A: SparseCSR, B: RealMatrix, _mtype: int = 11) -> RealMatrix:
+    """
+    Calculates the solutions of a set of sparse linear equations with multiple right-hand sides (the columns of `B`).
+    The matrix is factorized once for all right-hand sides.
+    """
+    ...
 
-    # release internal memory
-    phase = mkl.c_int(-1)
-    mkl.pardiso(
-        pt, byref(maxfct), byref(mnum), byref(mtype), byref(phase), byref(n), a, ia, ja, perm, byref(nrhs), iparm,
-        byref(msglvl), b, x, byref(error)
-    )
-    if error.value != 0:
-        raise RuntimeError("external computational error")
+def spsolve(A: SparseCSR, B: RealVector | RealMatrix, _mtype: int = 11) -> RealVector | RealMatrix:
+    # check arguments
+    if A.rowCount != A.columnCount: raise ValueError("'A' must be a square sparse matrix")
+    if B.ndim not in (1, 2) or B.shape[0] != A.rowCount:
+        raise ValueError(f"'B' must be a vector or a matrix with {A.rowCount} rows")
 
-    # done
-    return X
+    # factorize and solve
+    return SparseFactorization(A, _mtype).solve(B)
 
 def speigen(A: SparseCSR, B: SparseCSR, k0: int, which: Literal["S", "L"]) -> tuple[RealVector, RealMatrix, RealVector]:
     """
@@ -8,9 +8,9 @@ import feapack.solver.procedures as pro
 import feapack.solver.linearAlgebra as linalg
 from typing import Literal
 from datetime import datetime
-from collections.abc import Sequence
+from collections.abc import Sequence, Iterable, Iterator, Mapping
 from feapack import __version__
-from feapack.model import MDB, ODB
+from feapack.model import MDB, ODB, NodeSet
 from feapack.typing import Real, RealVector, RealMatrix
 
 _printFlag: bool = False
@@ -32,13 +32,22 @@ def _log(message: str = "", append: bool = True) -> None:
         with open(_logFilePath, "a" if append else "w") as logFile:
             logFile.write(message + "\n")
 
-def _staticAnalysis(mdb: MDB, processes: int) -> None:
-    """Performs a linear-elastic static analysis."""
+def _staticAnalysis(
+    mdb: MDB, processes: int, cache: list[RealMatrix] | None = None, odb: ODB | None = None,
+    description: str = "Increment 1: Time = 1.0"
+) -> None:
+    """
+    Performs a linear-elastic static analysis.
+    The input parameter `cache: list[RealMatrix] | None` optionally caches the element stiffness matrices.
+    The input parameter `odb: ODB | None` optionally specifies an output database to append the final output frame to;
+    in this case, the initial output frame is not written. The input parameter `description: str` specifies the
+    description of the final output frame.
+    """
     # log
     _log("Building algebraic system...")
 
     # compute stiffness matrix
-    Kaa, Kab, Kba, Kbb = pro.assembleStiffnessMatrix(mdb, processes)
+    Kaa, Kab, Kba, Kbb = pro.assembleStiffnessMatrix(mdb, processes, cache)
 
     # compute equivalent nodal load vector
     Pa: RealVector = np.zeros(shape=(mdb.mesh.activeDOFCount,), dtype=Real)
@@ -53,7 +62,9 @@ def _staticAnalysis(mdb: MDB, processes: int) -> None:
     _log("Solving algebraic system...")
 
     # compute unknown nodal displacement vector (solution)
-    rhs: RealVector = Pa - linalg.spmatmul(Kab, Ub)
+    # the product is accumulated in-place into a copy of the load vector (no temporary vector for the product)
+    rhs: RealVector = np.array(Pa, dtype=Real)
+    linalg.spmatmul(Kab, Ub, rhs, alpha=-1.0)
     Ua: RealVector = linalg.spsolve(Kaa, rhs)
 
     # log
@@ -63,7 +74,9 @@ def _staticAnalysis(mdb: MDB, processes: int) -> None:
     U: float = 0.5*np.dot(Ua, rhs)
 
     # compute unknown nodal load vector (reaction forces)
-    Pb: RealVector = linalg.spmatmul(Kba, Ua) + linalg.spmatmul(Kbb, Ub)
+    # the second product is accumulated in-place into the first (no temporary vectors)
+    Pb: RealVector = linalg.spmatmul(Kba, Ua)
+    linalg.spmatmul(Kbb, Ub, Pb)
 
     # compute internal nodal force vector
     # also computes the basic components of strain and stress at the integration points
@@ -89,19 +102,18 @@ def _staticAnalysis(mdb: MDB, processes: int) -> None:
     reac: RealMatrix = pro.unshuffleVector(mdb, None, Pb)
     forc: RealMatrix = pro.unshuffleVector(mdb, Pa, None)
 
-    # log
-    _log("Writing output frame 0 to file...")
-
-    # write to file: initial state
-    odb: ODB = ODB(_outFilePath, mode="write", replace=True)
-    odb.writeNextFrame(description="Increment 0: Time = 0.0", mesh=mdb.mesh)
+    # write to file: initial state (unless appending to an existing output database)
+    if odb is None:
+        _log("Writing output frame 0 to file...")
+        odb = ODB(_outFilePath, mode="write", replace=True)
+        odb.writeNextFrame(description="Increment 0: Time = 0.0", mesh=mdb.mesh)
 
     # log
-    _log("Writing output frame 1 to file...")
+    _log(f"Writing output frame {odb.currentFrame + 1} to file...")
 
     # write to file: deformed state
     odb.writeNextFrame(
-        description="Increment 1: Time = 1.0",
+        description=description,
         mesh=mdb.mesh,
         nodeOutput={
             "Displacement>Displacement in X":             disp[:,  0],
@@ -147,10 +159,11 @@ def _staticAnalysis(mdb: MDB, processes: int) -> None:
         }
     )
 
-def _frequencyAnalysis(mdb: MDB, k0: int, processes: int) -> None:
+def _frequencyAnalysis(mdb: MDB, k0: int, processes: int, odb: ODB | None = None) -> None:
     """
     Performs a frequency analysis (extraction of undamped natural frequencies and corresponding mode shapes).
     The input parameter `k0: int` corresponds to the requested number of eigenvalues and eigenvectors.
+    The input parameter `odb: ODB | None` optionally specifies an output database to append the output frames to.
     """
     # log
     _log("Building algebraic system...")
@@ -174,17 +187,16 @@ def _frequencyAnalysis(mdb: MDB, k0: int, processes: int) -> None:
     frequencies: RealVector = np.sqrt(eigenvalues)/(2.0*np.pi)
 
     # normalize eigenvectors with respect to the mass matrix
-    for i in range(eigenvalues.size):
-        φi: RealVector = eigenvectors[:, i]
-        norm: float = np.sqrt(np.dot(φi, linalg.spmatmul(Maa, φi)))
-        eigenvectors[:, i] = φi/norm
+    # all products with the mass matrix are computed at once, in a single traversal of the sparse matrix
+    norms: RealVector = np.sqrt(np.einsum("ij,ij->j", eigenvectors, linalg.spmatmul(Maa, eigenvectors)))
+    eigenvectors = eigenvectors/norms
 
-    # write to file
-    odb: ODB = ODB(_outFilePath, mode="write", replace=True)
+    # write to file (unless appending to an existing output database)
+    if odb is None: odb = ODB(_outFilePath, mode="write", replace=True)
     for i in range(eigenvalues.size):
 
         # log
-        _log(f"Writing output frame {i} to file...")
+        _log(f"Writing output frame {odb.currentFrame + 1} to file...")
 
         # write frame
         disp: RealMatrix = pro.unshuffleVector(mdb, eigenvectors[:, i], None)
@@ -204,10 +216,11 @@ def _frequencyAnalysis(mdb: MDB, k0: int, processes: int) -> None:
             }
         )
 
-def _bucklingAnalysis(mdb: MDB, k0: int, processes: int) -> None:
+def _bucklingAnalysis(mdb: MDB, k0: int, processes: int, odb: ODB | None = None) -> None:
     """
     Performs an eigenvalue buckling analysis (extraction of critical loads and corresponding mode shapes).
     The input parameter `k0: int` corresponds to the requested number of eigenvalues and eigenvectors.
+    The input parameter `odb: ODB | None` optionally specifies an output database to append the output frames to.
     """
     # log
     _log("Building algebraic system for static analysis...")
@@ -228,7 +241,9 @@ def _bucklingAnalysis(mdb: MDB, k0: int, processes: int) -> None:
     _log("Solving algebraic system (static analysis)...")
 
     # compute unknown nodal displacement vector (solution of static analysis)
-    rhs: RealVector = Pa - linalg.spmatmul(Kab, Ub)
+    # the product is accumulated in-place into a copy of the load vector (no temporary vector for the product)
+    rhs: RealVector = np.array(Pa, dtype=Real)
+    linalg.spmatmul(Kab, Ub, rhs, alpha=-1.0)
     Ua: RealVector = linalg.spsolve(Kaa, rhs)
 
     # log
@@ -253,12 +268,12 @@ def _bucklingAnalysis(mdb: MDB, k0: int, processes: int) -> None:
         norm: float = np.max(np.abs(φi))
         eigenvectors[:, i] = φi/norm
 
-    # write to file
-    odb: ODB = ODB(_outFilePath, mode="write", replace=True)
+    # write to file (unless appending to an existing output database)
+    if odb is None: odb = ODB(_outFilePath, mode="write", replace=True)
     for i in range(eigenvalues.size):
 
         # log
-        _log(f"Writing output frame {i} to file...")
+        _log(f"Writing output frame {odb.currentFrame + 1} to file...")
 
         # write frame
         disp: RealMatrix = pro.unshuffleVector(mdb, eigenvectors[:, i], None)
@@ -279,7 +294,7 @@ def _bucklingAnalysis(mdb: MDB, k0: int, processes: int) -> None:
 
 def solve(
     mdb: MDB, analysis: Literal["static", "frequency", "buckling"], k0: int = 10, jobName: str = "", processes: int = 1,
-    printLog: bool = True, writeLog: bool = True
+    printLog: bool = True, writeLog: bool = True, odb: ODB | None = None, description: str = "Increment 1: Time = 1.0"
 ) -> None:
     """
     Performs the specified finite element analysis.
@@ -305,7 +320,65 @@ def solve(
 
     * `writeLog: bool = True` (optional) determines if log messages are to be written to the log file; by default, a log
     file is created, replacing any existing.
+
+    * `odb: ODB | None = None` (optional) specifies an output database, opened in "write" mode, to append the output
+    frames to; by default, a new .out file is created, replacing any existing. For a "static" analysis, only the final
+    output frame is appended (the initial, undeformed, output frame is skipped).
+
+    * `description: str = "Increment 1: Time = 1.0"` (optional) specifies the description of the final output frame of
+    a "static" analysis; ignored for a "frequency" or "buckling" analysis.
+    """
+    _solve(mdb, analysis, k0, jobName, processes, printLog, writeLog, odb, description=description)
+
+def solveSeries(
+    mdb: MDB, steps: Iterable[Mapping[str, NodeSet]], jobName: str = "", processes: int = 1, printLog: bool = True,
+    writeLog: bool = True, odb: ODB | None = None, descriptions: Iterable[str] = ()
+) -> None:
     """
+    Performs a series of linear-elastic static analyses in which only the node sets change between analyses, e.g., when
+    releasing crack nodes. Since the mesh, sections, and materials are unchanged, the element stiffness matrices are
+    computed in the first analysis and reused in the following analyses.
+
+    Input parameters:
+    * `mdb: MDB` specifies the finite element model database for the analyses.
+
+    * `steps: Iterable[Mapping[str, NodeSet]]` specifies, for each analysis, the node sets to be replaced (by name) in
+    the model database before solving. Hence, concentrated loads and boundary conditions applied to these node sets are
+    updated accordingly.
+
+    * `jobName: str = ""` (optional) specifies the base name for the .log and .out files; the index of each analysis is
+    appended to this name, e.g., 'my_job_000.out', 'my_job_001.out', ...; by default, the calling script file name is
+    used.
+
+    * `processes: int = 1` (optional) specifies the number of processes to use (see `solve`).
+
+    * `printLog: bool = True` (optional) determines if log messages are to be printed (see `solve`).
+
+    * `writeLog: bool = True` (optional) determines if log messages are to be written to the log files (see `solve`).
+
+    * `odb: ODB | None = None` (optional) specifies an output database, opened in "write" mode, to append the final
+    output frame of each analysis to; by default, a new .out file is created for each analysis. Writing all analyses to
+    a single output database avoids writing, and then merging, multiple output files.
+
+    * `descriptions: Iterable[str] = ()` (optional) specifies the descriptions of the final output frame of each
+    analysis; analyses without a corresponding description use the default one. Consumed lazily, hence this may be a
+    generator.
+    """
+    if not jobName: jobName = sys.argv[0]
+    baseName: str = os.path.splitext(jobName)[0]
+    cache: list[RealMatrix] = []
+    descriptionIterator: Iterator[str] = iter(descriptions)
+    for i, nodeSets in enumerate(steps):
+        for name, nodeSet in nodeSets.items(): mdb.nodeSets[name] = nodeSet
+        description: str = next(descriptionIterator, "Increment 1: Time = 1.0")
+        _solve(mdb, "static", 0, f"{baseName}_{i:03}", processes, printLog, writeLog, odb, cache, description)
+
+def _solve(
+    mdb: MDB, analysis: Literal["static", "frequency", "buckling"], k0: int, jobName: str, processes: int,
+    printLog: bool, writeLog: bool, odb: ODB | None = None, cache: list[RealMatrix] | None = None,
+    description: str = "Increment 1: Time = 1.0"
+) -> None:
+    """Performs the specified finite element analysis (see `solve`)."""
     # log and output files
     global _logFilePath, _outFilePath, _printFlag, _writeFlag
     if not jobName: jobName = sys.argv[0]
@@ -380,15 +453,15 @@ def solve(
             case "static":
                 _log("STATIC ANALYSIS")
                 _log("---------------")
-                _staticAnalysis(mdb, processes)
+                _staticAnalysis(mdb, processes, cache, odb, description)
             case "frequency":
                 _log("FREQUENCY ANALYSIS")
                 _log("------------------")
-                _frequencyAnalysis(mdb, k0, processes)
+                _frequencyAnalysis(mdb, k0, processes, odb)
             case "buckling":
                 _log("BUCKLING ANALYSIS")
                 _log("-----------------")
-                _bucklingAnalysis(mdb, k0, processes)
+                _bucklingAnalysis(mdb, k0, processes, odb)
             case _:
                 raise ValueError(f"undefined analysis type: '{analysis}'")
         _log()
@@ -4,7 +4,7 @@ from typing import Any
 from multiprocessing import Pool
 from collections.abc import Iterable, Sequence, Callable
 from feapack.model import MDB, Node, Element, Surface, SectionTypes
-from feapack.typing import Float3D, IntTuple, Tuple, Int, IntVector, Real, RealVector, RealMatrix
+from feapack.typing import Float3D, IntTuple, Tuple, Int, IntVector, IntMatrix, Real, RealVector, RealMatrix, RealTensor
 from feapack.solver import SparseCSR
 
 #-----------------------------------------------------------------------------------------------------------------------
@@ -122,6 +122,45 @@ def strainDisplacementMatrix(element: Element, coord: RealVector, N: RealVector,
                 )
     return B
 
+def strainDisplacementMatrices(element: Element, coord: RealMatrix, N: RealVector, Nx: RealTensor) -> RealTensor:
+    """
+    Batched version of `strainDisplacementMatrix` for multiple elements sharing the same type and section as the
+    specified element. Returns the strain-displacement matrices stacked along the first axis.
+    """
+    B: RealTensor
+    match element.section.type:
+        case SectionTypes.PlaneStress:
+            B = np.zeros(shape=(Nx.shape[0], 3, element.dofCount), dtype=Real)
+            B[:, 0, 0::2] = Nx[:, 0, :]
+            B[:, 1, 1::2] = Nx[:, 1, :]
+            B[:, 2, 0::2] = Nx[:, 1, :]
+            B[:, 2, 1::2] = Nx[:, 0, :]
+        case SectionTypes.PlaneStrain:
+            B = np.zeros(shape=(Nx.shape[0], 4, element.dofCount), dtype=Real)
+            B[:, 0, 0::2] = Nx[:, 0, :]
+            B[:, 1, 1::2] = Nx[:, 1, :]
+            B[:, 3, 0::2] = Nx[:, 1, :]
+            B[:, 3, 1::2] = Nx[:, 0, :]
+        case SectionTypes.Axisymmetric:
+            B = np.zeros(shape=(Nx.shape[0], 4, element.dofCount), dtype=Real)
+            B[:, 0, 0::2] = Nx[:, 0, :]
+            B[:, 1, 1::2] = Nx[:, 1, :]
+            B[:, 2, 0::2] = N/coord[:, 0:1]
+            B[:, 3, 0::2] = Nx[:, 1, :]
+            B[:, 3, 1::2] = Nx[:, 0, :]
+        case SectionTypes.General:
+            B = np.zeros(shape=(Nx.shape[0], 6, element.dofCount), dtype=Real)
+            B[:, 0, 0::3] = Nx[:, 0, :]
+            B[:, 1, 1::3] = Nx[:, 1, :]
+            B[:, 2, 2::3] = Nx[:, 2, :]
+            B[:, 3, 1::3] = Nx[:, 2, :]
+            B[:, 3, 2::3] = Nx[:, 1, :]
+            B[:, 4, 0::3] = Nx[:, 2, :]
+            B[:, 4, 2::3] = Nx[:, 0, :]
+            B[:, 5, 0::3] = Nx[:, 1, :]
+            B[:, 5, 1::3] = Nx[:, 0, :]
+    return B
+
 def interpolationMatrix(element: Element | Surface, N: RealVector) -> RealMatrix:
     """Returns the element/surface interpolation matrix."""
     indices: Iterable[int] = element.localNodeIndices if isinstance(element, Surface) else range(element.nodeCount)
@@ -145,6 +184,20 @@ def stiffnessMatrix(element: Element) -> RealMatrix:
         K += np.matmul(B.T, np.matmul(D, B))*vol
     return K
 
+def stiffnessMatrices(element: Element, X: RealTensor) -> RealTensor:
+    """
+    Batched version of `stiffnessMatrix` for multiple elements sharing the same type, section, and material as the
+    specified element. The nodal coordinate matrices `X` are stacked along the first axis (one matrix per element).
+    Returns the element stiffness matrices stacked along the first axis.
+    """
+    K: RealTensor = np.zeros(shape=(X.shape[0], element.dofCount, element.dofCount), dtype=Real)
+    D: RealMatrix = stressStrainMatrix(element)
+    for intPt, weight in zip(*iso.integrationPoints(element)):
+        coord, N, Nx, vol = iso.evaluateElements(element, X, intPt, weight)
+        B: RealTensor = strainDisplacementMatrices(element, coord, N, Nx)
+        K += np.matmul(B.transpose(0, 2, 1), np.matmul(D, B))*vol[:, np.newaxis, np.newaxis]
+    return K
+
 def massMatrix(element: Element) -> RealMatrix:
     """Returns the element mass matrix."""
     M: RealMatrix = np.zeros(shape=(element.dofCount, element.dofCount), dtype=Real)
@@ -252,6 +305,9 @@ def internalForceVector(element: Element, Ua: RealVector, Ub: RealVector) -> tup
 # ASSEMBLAGE
 #-----------------------------------------------------------------------------------------------------------------------
 
+batchSize: int = 1024
+"""Maximum number of elements per batch when computing element matrices in batches."""
+
 def loop[T](procedure: Callable[..., T], arguments: Iterable[Tuple[Any]], processes: int) -> Sequence[T]:
     """
     Executes the specified procedure once for each entry in the sequence of arguments and returns the sequence of
@@ -263,6 +319,38 @@ def loop[T](procedure: Callable[..., T], arguments: Iterable[Tuple[Any]], proces
     else:
         return [*map(lambda x: procedure(*x), arguments)]
 
+def batchedElementMatrices(mdb: MDB, procedure: Callable[[Element, RealTensor], RealTensor], processes: int) -> \
+    Sequence[RealMatrix]:
+    """
+    Computes the element matrices for all mesh elements, in batches of elements sharing the same type, section, and
+    material. The specified batched procedure receives a reference element and the stacked element nodal coordinates.
+    Batches may be computed in parallel by using multiple processes. Returns the element matrices by element index.
+    """
+    # group elements sharing the same type, section, and material
+    groups: dict[tuple[Any, ...], list[Element]] = {}
+    for element in mdb.mesh.elements:
+        groups.setdefault((element.type, id(element.section), id(element.material)), []).append(element)
+
+    # split groups into batches (bounded size, at least one batch per process)
+    batches: list[list[Element]] = []
+    for group in groups.values():
+        size: int = max(1, min(batchSize, -(-len(group)//max(processes, 1))))
+        batches.extend(group[i:i + size] for i in range(0, len(group), size))
+
+    # create the sequence of procedure arguments for the batch loop:
+    # join each reference element with the stacked nodal coordinates of the batch
+    arguments: list[tuple[Element, RealTensor]] = []
+    for batch in batches:
+        connectivity: IntMatrix = np.array([element.nodeIndices for element in batch], dtype=Int)
+        arguments.append((batch[0], mdb.mesh.coordinates[connectivity]))
+
+    # compute element matrices and sort them by element index
+    matrices: list[RealMatrix] = [np.empty(shape=(0, 0), dtype=Real)]*mdb.mesh.elementCount
+    for batch, stack in zip(batches, loop(procedure, arguments, processes)):
+        for element, matrix in zip(batch, stack):
+            matrices[element.index] = matrix
+    return matrices
+
 def assembleMatrix(
     elements: Sequence[Element], matrices: Sequence[RealMatrix], activeDOFCount: int, inactiveDOFCount: int
 ) -> tuple[SparseCSR, SparseCSR, SparseCSR, SparseCSR]:
@@ -318,14 +406,15 @@ def assembleMatrix(
         j_ab: int = i_ab + len(alDOFs)*len(ilDOFs)
         j_ba: int = i_ba + len(ilDOFs)*len(alDOFs)
         j_bb: int = i_bb + len(ilDOFs)*len(ilDOFs)
-        (r_aa, c_aa), v_aa = np.meshgrid(agDOFs, agDOFs), A[np.ix_(alDOFs, alDOFs)]
-        (r_ab, c_ab), v_ab = np.meshgrid(agDOFs, igDOFs), A[np.ix_(alDOFs, ilDOFs)]
-        (r_ba, c_ba), v_ba = np.meshgrid(igDOFs, agDOFs), A[np.ix_(ilDOFs, alDOFs)]
-        (r_bb, c_bb), v_bb = np.meshgrid(igDOFs, igDOFs), A[np.ix_(ilDOFs, ilDOFs)]
-        rows_aa[i_aa:j_aa] = r_aa.T.flat; cols_aa[i_aa:j_aa] = c_aa.T.flat; vals_aa[i_aa:j_aa] = v_aa.flat
-        rows_ab[i_ab:j_ab] = r_ab.T.flat; cols_ab[i_ab:j_ab] = c_ab.T.flat; vals_ab[i_ab:j_ab] = v_ab.flat
-        rows_ba[i_ba:j_ba] = r_ba.T.flat; cols_ba[i_ba:j_ba] = c_ba.T.flat; vals_ba[i_ba:j_ba] = v_ba.flat
-        rows_bb[i_bb:j_bb] = r_bb.T.flat; cols_bb[i_bb:j_bb] = c_bb.T.flat; vals_bb[i_bb:j_bb] = v_bb.flat
+        # row-major triplets of each sub-matrix block: rows repeat each global DOF, columns tile the global DOFs
+        rows_aa[i_aa:j_aa] = np.repeat(agDOFs, len(alDOFs)); cols_aa[i_aa:j_aa] = np.tile(agDOFs, len(alDOFs))
+        rows_ab[i_ab:j_ab] = np.repeat(agDOFs, len(ilDOFs)); cols_ab[i_ab:j_ab] = np.tile(igDOFs, len(alDOFs))
+        rows_ba[i_ba:j_ba] = np.repeat(igDOFs, len(alDOFs)); cols_ba[i_ba:j_ba] = np.tile(agDOFs, len(ilDOFs))
+        rows_bb[i_bb:j_bb] = np.repeat(igDOFs, len(ilDOFs)); cols_bb[i_bb:j_bb] = np.tile(igDOFs, len(ilDOFs))
+        vals_aa[i_aa:j_aa] = A[np.ix_(alDOFs, alDOFs)].flat
+        vals_ab[i_ab:j_ab] = A[np.ix_(alDOFs, ilDOFs)].flat
+        vals_ba[i_ba:j_ba] = A[np.ix_(ilDOFs, alDOFs)].flat
+        vals_bb[i_bb:j_bb] = A[np.ix_(ilDOFs, ilDOFs)].flat
         i_aa = j_aa
         i_ab = j_ab
         i_ba = j_ba
@@ -354,13 +443,21 @@ def assembleVector(
         Vb[element.inactiveGlobalDOFs,] += V[element.inactiveLocalDOFs,]
     return Va, Vb
 
-def assembleStiffnessMatrix(mdb: MDB, processes: int) -> tuple[SparseCSR, SparseCSR, SparseCSR, SparseCSR]:
+def assembleStiffnessMatrix(mdb: MDB, processes: int, cache: list[RealMatrix] | None = None) -> \
+    tuple[SparseCSR, SparseCSR, SparseCSR, SparseCSR]:
     """
     Assembles the system's global stiffness matrix via the direct stiffness method.
-    Assembly may be performed in parallel for each element by using multiple processes.
+    Element matrices are computed in batches, which may be performed in parallel by using multiple processes.
+    If a cache is given, the element matrices are stored in it (if empty) or reused from it (otherwise).
     """
-    # compute each element matrix and assemble them into a global system matrix
-    matrices: Sequence[RealMatrix] = loop(stiffnessMatrix, zip(mdb.mesh.elements), processes)
+    # compute each element matrix (unless cached)
+    if cache:
+        matrices: Sequence[RealMatrix] = cache
+    else:
+        matrices: Sequence[RealMatrix] = batchedElementMatrices(mdb, stiffnessMatrices, processes)
+        if cache is not None: cache.extend(matrices)
+
+    # assemble element matrices into a global system matrix
     Kaa, Kab, Kba, Kbb = assembleMatrix(mdb.mesh.elements, matrices, mdb.mesh.activeDOFCount, mdb.mesh.inactiveDOFCount)
     return Kaa, Kab, Kba, Kbb
 
@@ -435,12 +532,12 @@ def assembleBodyLoadVector(mdb: MDB, processes: int) -> RealVector:
     # join each element with the corresponding load components
     arguments: list[tuple[Element, Float3D]] = []
     for acceleration in mdb.accelerations.values():
-        for elementIndex in mdb.elementSets[acceleration.region].indices:
+        for elementIndex in mdb.elementSets[acceleration.region].indices.tolist():
             element: Element = mdb.mesh.elements[elementIndex]
             ρ: float = element.material.density
             arguments.append((element, (ρ*acceleration.x, ρ*acceleration.y, ρ*acceleration.z)))
     for bodyLoad in mdb.bodyLoads.values():
-        for elementIndex in mdb.elementSets[bodyLoad.region].indices:
+        for elementIndex in mdb.elementSets[bodyLoad.region].indices.tolist():
             element: Element = mdb.mesh.elements[elementIndex]
             arguments.append((element, (bodyLoad.x, bodyLoad.y, bodyLoad.z)))
 
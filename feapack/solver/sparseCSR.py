@@ -2,7 +2,7 @@ import numpy as np
 import numpy.ctypeslib as npc
 import feapack.c.libmkl as mkl
 from ctypes import byref
-from feapack.typing import Int, IntVector, RealVector
+from feapack.typing import Int, Real, IntVector, RealVector
 
 class SparseCSR:
     """Sparse matrix storage in CSR format."""
@@ -48,6 +48,15 @@ class SparseCSR:
         unitDiagonal: int = mkl.SPARSE_DIAG_NON_UNIT
     ) -> None:
         """Creates a new sparse matrix storage in CSR format from COO-type data."""
+        # the external routines use 32-bit indexing, hence the sizes must be representable (otherwise, casting wraps)
+        if max(rowCount, columnCount, np.size(values)) > np.iinfo(Int).max:
+            raise ValueError("sparse matrix too large for 32-bit indexing")
+
+        # the external routines require C-contiguous arrays of the expected types (copies are made only if necessary)
+        rowIndices = np.ascontiguousarray(rowIndices, dtype=Int)
+        columnIndices = np.ascontiguousarray(columnIndices, dtype=Int)
+        values = np.ascontiguousarray(values, dtype=Real)
+
         # basic checks
         if values.size != rowIndices.size or values.size != columnIndices.size: raise ValueError("array size mismatch")
         if np.min(columnIndices) < 0 or np.max(columnIndices) >= columnCount: raise ValueError("index out of bounds")   # type: ignore
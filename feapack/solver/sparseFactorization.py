@@ -0,0 +1,153 @@
+import numpy as np
+import numpy.ctypeslib as npc
+import feapack.c.libmkl as mkl
+from ctypes import byref
+from feapack.solver import SparseCSR
+from feapack.typing import Real, RealVector, RealMatrix
+
+class SparseFactorization:
+    """
+    Factorization of a square sparse matrix computed by PARDISO. The analysis (reordering and symbolic factorization)
+    and the numerical factorization are computed once, upon creation, and may then be reused to solve for any number
+    of right-hand sides.
+    """
+
+    __slots__ = ("_matrix", "_pt", "_maxfct", "_mnum", "_mtype", "_n", "_perm", "_iparm", "_msglvl")
+
+    @property
+    def matrix(self) -> SparseCSR:
+        """The factorized sparse matrix."""
+        return self._matrix
+
+    def __init__(self, A: SparseCSR, _mtype: int = 11) -> None:
+        """Creates a new factorization of the specified square sparse matrix."""
+        # check arguments
+        if A.rowCount != A.columnCount: raise ValueError("'A' must be a square sparse matrix")
+
+        # keep a reference to the matrix, whose data is required by all subsequent phases
+        self._matrix: SparseCSR = A
+
+        # solver internal data address pointer
+        self._pt = npc.as_ctypes(np.zeros(shape=(64,), dtype=np.int64))
+
+        # maximal number of factors in memory
+        self._maxfct = mkl.c_int(1)
+
+        # the number of matrix to solve
+        self._mnum = mkl.c_int(1)
+
+        # matrix type
+        #  1: real and structurally symmetric
+        #  2: real and symmetric positive definite
+        # -2: real and symmetric indefinite
+        #  3: complex and structurally symmetric
+        #  4: complex and Hermitian positive definite
+        # -4: complex and Hermitian indefinite
+        #  6: complex and symmetric matrix
+        # 11: real and non-symmetric matrix
+        # 13: complex and non-symmetric matrix
+        self._mtype = mkl.c_int(_mtype)
+
+        # number of equations in the sparse linear system
+        self._n = mkl.c_int(A.rowCount)
+
+        # the permutation vector
+        self._perm = (mkl.c_int*A.rowCount)()
+
+        # Intel oneMKL PARDISO parameters
+        self._iparm = (mkl.c_int*64)()
+        self._iparm[0]     = 1
+        self._iparm[1]     = 3
+        self._iparm[2]     = 0
+        self._iparm[3]     = 0
+        self._iparm[4]     = 0
+        self._iparm[5]     = 0
+        self._iparm[6]     = 0
+        self._iparm[7]     = 0
+        self._iparm[8]     = 0
+        self._iparm[9]     = 13 if _mtype in (11, 13) else 8 if _mtype in (-2, -4, 6) else 0
+        self._iparm[10]    = 1 if _mtype in (11, 13) else 0
+        self._iparm[11]    = 0
+        self._iparm[12]    = 1 if _mtype in (11, 13) else 0
+        self._iparm[13:17] = 0, 0, 0, 0
+        self._iparm[17]    = -1
+        self._iparm[18]    = 0
+        self._iparm[19]    = 0
+        self._iparm[20]    = 1
+        self._iparm[21:23] = 0, 0
+        self._iparm[23]    = 0
+        self._iparm[24]    = 0
+        self._iparm[25]    = 0
+        self._iparm[26]    = 0
+        self._iparm[27]    = 0
+        self._iparm[28]    = 0
+        self._iparm[29]    = 0
+        self._iparm[30]    = 0
+        self._iparm[31:33] = 0, 0
+        self._iparm[33]    = 0
+        self._iparm[34]    = 1
+        self._iparm[35]    = 0
+        self._iparm[36]    = 0
+        self._iparm[37]    = 0
+        self._iparm[38]    = 0
+        self._iparm[39:42] = 0, 0, 0
+        self._iparm[42]    = 0
+        self._iparm[43:55] = 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+        self._iparm[55]    = 0
+        self._iparm[56:59] = 0, 0, 0
+        self._iparm[59]    = 0
+        self._iparm[60:62] = 0, 0
+        self._iparm[62]    = 0
+        self._iparm[63]    = 0
+
+        # message level information
+        self._msglvl = mkl.c_int(0)
+
+        # analysis and numerical factorization
+        dummy: RealVector = np.zeros(shape=(1,), dtype=Real)
+        self._pardiso(12, 1, dummy, dummy)
+
+    def solve(self, B: RealVector | RealMatrix) -> RealVector | RealMatrix:
+        """
+        Calculates the solution of the factorized set of sparse linear equations. The right-hand side `B` may be a
+        vector or a matrix, in which case each column is a right-hand side.
+        """
+        # check arguments
+        if B.ndim not in (1, 2) or B.shape[0] != self._n.value:
+            raise ValueError(f"'B' must be a vector or a matrix with {self._n.value} rows")
+
+        # right-hand sides and solutions are stored contiguously (one after the other)
+        nrhs: int = 1 if B.ndim == 1 else B.shape[1]
+        b: RealVector = np.ascontiguousarray(B.T, dtype=Real).reshape(-1)
+        x: RealVector = np.zeros(shape=b.shape, dtype=Real)
+
+        # solve and iterative refinement
+        self._pardiso(33, nrhs, b, x)
+        return x if B.ndim == 1 else x.reshape(nrhs, self._n.value).T
+
+    def _pardiso(self, phase: int, nrhs: int, b: RealVector, x: RealVector) -> None:
+        """
+        Calls the external computational routine for the specified phase:
+        * 12: analysis, numerical factorization
+        * 22: numerical factorization
+        * 33: solve, iterative refinement
+        * -1: release all internal memory for all matrices
+        """
+        # the arrays are passed as typed data pointers, which avoids building a ctypes array object for each array
+        values, columns, rowIndex = self._matrix.CSR3
+        error = mkl.c_int(1)
+        mkl.pardiso(
+            self._pt, byref(self._maxfct), byref(self._mnum), byref(self._mtype), byref(mkl.c_int(phase)),
+            byref(self._n), values.ctypes.data_as(mkl.c_double_p), rowIndex.ctypes.data_as(mkl.c_int_p),
+            columns.ctypes.data_as(mkl.c_int_p), self._perm, byref(mkl.c_int(nrhs)), self._iparm, byref(self._msglvl),
+            b.ctypes.data_as(mkl.c_double_p), x.ctypes.data_as(mkl.c_double_p), byref(error)
+        )
+        if error.value != 0:
+            raise RuntimeError("external computational error")
+
+    def __del__(self) -> None:
+        """Frees externally allocated memory."""
+        # nothing to free if the initialization failed before any call to the external solver, e.g., a non-square matrix
+        if not hasattr(self, "_msglvl"): return
+        dummy: RealVector = np.zeros(shape=(1,), dtype=Real)
+        self._pardiso(-1, 1, dummy, dummy)
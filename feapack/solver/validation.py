@@ -11,7 +11,7 @@ def _checkMesh(mdb: MDB, errors: list[str], warnings: list[str]) -> None:
     counts: list[int] = [0]*mdb.mesh.elementCount
     for section in mdb.sections.values():
         if section.region in mdb.elementSets.keys():
-            for elementIndex in mdb.elementSets[section.region].indices:
+            for elementIndex in mdb.elementSets[section.region].indices.tolist():
                 if 0 <= elementIndex < mdb.mesh.elementCount:
                     counts[elementIndex] += 1
     if counts.count(1) != len(counts):
@@ -32,7 +32,7 @@ def _checkElementSets(mdb: MDB, errors: list[str], warnings: list[str]) -> None:
     for name, elementSet in mdb.elementSets.items():
         if len(elementSet.indices) == 0:
             warnings.append(f"element set '{name}' is empty")
-        elif min(elementSet.indices) < 0 or max(elementSet.indices) >= mdb.mesh.elementCount:
+        elif elementSet.indices[0] < 0 or elementSet.indices[-1] >= mdb.mesh.elementCount:
             errors.append(f"element set '{name}' contains invalid indices")
 
 def _checkSurfaceSets(mdb: MDB, errors: list[str], warnings: list[str]) -> None:
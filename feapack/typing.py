@@ -37,3 +37,6 @@ type IntMatrix = Annotated[npt.NDArray[Int], ["M", "N"]]
 
 type RealMatrix = Annotated[npt.NDArray[Real], ["M", "N"]]
 """A type alias representing a matrix of real numbers."""
+
+type RealTensor = Annotated[npt.NDArray[Real], ["L", "M", "N"]]
+"""A type alias representing a stack of matrices of real numbers (3rd-order tensor)."""
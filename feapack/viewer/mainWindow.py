@@ -508,6 +508,9 @@ class MainWindow(QMainWindow):
         # get current ODB file path
         filePath: str | None = self._odb.filePath if self._odb else None
 
+        # close file
+        if self._odb: self._odb.close()
+
         # set ODB and ODBView objects to None
         self._odb = None
         self._odbView = None